@@ -10,7 +10,7 @@ import subprocess
 import tempfile
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple
-from urllib.parse import urlparse, parse_qs
+from urllib.parse import urlsplit
 
 try:
     import requests
@@ -109,19 +109,20 @@ class URLResolver:
         if not url:
             raise ConfluenceClientError("URL cannot be empty")
         
+        if not isinstance(url, str):
+            raise ConfluenceClientError(f"URL must be a string, got {type(url)}")
+        
         try:
-            parsed = urlparse(url)
-            if not parsed.scheme or not parsed.netloc:
-                raise ConfluenceClientError(
-                    f"Invalid URL format. Expected format: https://domain.com/path. "
-                    f"Got: {url}"
-                )
-            base_url = f"{parsed.scheme}://{parsed.netloc}"
-            return base_url
-        except ConfluenceClientError:
-            raise
-        except Exception as e:
+            parsed = urlsplit(url.strip())
+        except ValueError as e:
             raise ConfluenceClientError(f"Could not extract base URL from {url}: {e}")
+        
+        if not parsed.scheme or not parsed.netloc:
+            raise ConfluenceClientError(
+                f"Invalid URL format. Expected format: https://domain.com/path. "
+                f"Got: {url}"
+            )
+        return f"{parsed.scheme}://{parsed.netloc}"
 
 
 class ConfluenceClient:
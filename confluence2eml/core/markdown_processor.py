@@ -3,9 +3,14 @@
 This module provides functionality to convert Markdown content to HTML
 for email generation. It uses the markdown library with extensions to
 handle tables, code blocks, and other advanced Markdown features.
+
+Setting the MARKDOWN_BACKEND environment variable to ``cmark`` switches
+conversion to the optional cmarkgfm package (a C implementation of GitHub
+Flavored Markdown) when it is installed.
 """
 
 import logging
+import os
 from typing import Optional
 
 try:
@@ -17,6 +22,11 @@ except ImportError:
     fenced_code = None
     codehilite = None
 
+try:
+    import cmarkgfm
+except ImportError:
+    cmarkgfm = None  # type: ignore
+
 logger = logging.getLogger(__name__)
 
 
@@ -52,6 +62,8 @@ class MarkdownProcessor:
         Args:
             extensions: List of markdown extensions to use.
                        Defaults to ['tables', 'fenced_code', 'codehilite']
+                       when None. An empty list disables all extensions;
+                       it no longer falls back to the defaults
             extension_configs: Configuration dictionary for extensions.
                              Keys are extension names, values are config dicts.
                              
@@ -65,7 +77,11 @@ class MarkdownProcessor:
             )
         
         # Default extensions for email-friendly HTML
-        self.extensions = extensions or ['tables', 'fenced_code', 'codehilite']
+        # (an empty list is kept, for plain Markdown without extensions)
+        self.extensions = (
+            extensions if extensions is not None
+            else ['tables', 'fenced_code', 'codehilite']
+        )
         
         # Default extension configurations
         default_configs = {
@@ -87,6 +103,25 @@ class MarkdownProcessor:
         
         self.extension_configs = default_configs
         
+        # cmarkgfm has no extension mechanism; it always renders GitHub
+        # Flavored Markdown, which covers tables and fenced code
+        self.use_cmark = os.environ.get('MARKDOWN_BACKEND', '').lower() == 'cmark'
+        if self.use_cmark and cmarkgfm is None:
+            logger.warning(
+                "MARKDOWN_BACKEND=cmark but cmarkgfm is not installed; "
+                "falling back to the markdown library"
+            )
+            self.use_cmark = False
+        elif self.use_cmark and (extensions is not None or extension_configs):
+            logger.warning(
+                "MARKDOWN_BACKEND=cmark ignores the requested extensions and "
+                "extension_configs; cmarkgfm always renders GitHub Flavored Markdown"
+            )
+        
+        # markdown.Markdown instance built on first conversion and reused
+        # (with reset()) so extensions are only loaded once per processor
+        self._md = None
+        
         logger.debug(
             f"MarkdownProcessor initialized with extensions: {self.extensions}"
         )
@@ -103,6 +138,10 @@ class MarkdownProcessor:
         Raises:
             MarkdownProcessorError: If conversion fails
             
+        Note:
+            Conversions reuse one markdown.Markdown instance, so a processor
+            must not be shared between threads.
+            
         Example:
             >>> processor = MarkdownProcessor()
             >>> html = processor.convert("# Title\\n\\nParagraph text.")
@@ -118,12 +157,16 @@ class MarkdownProcessor:
             logger.debug("Converting Markdown to HTML...")
             logger.debug(f"Input length: {len(markdown_content)} characters")
             
-            # Convert Markdown to HTML using configured extensions
-            html_content = markdown.markdown(
-                markdown_content,
-                extensions=self.extensions,
-                extension_configs=self.extension_configs
-            )
+            if self.use_cmark:
+                html_content = cmarkgfm.github_flavored_markdown_to_html(markdown_content)
+            else:
+                # Convert Markdown to HTML using configured extensions
+                if self._md is None:
+                    self._md = markdown.Markdown(
+                        extensions=self.extensions,
+                        extension_configs=self.extension_configs
+                    )
+                html_content = self._md.reset().convert(markdown_content)
             
             logger.debug(f"Conversion complete. Output length: {len(html_content)} characters")
             
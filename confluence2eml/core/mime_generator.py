@@ -6,6 +6,7 @@ serialize them to .eml format for email clients.
 
 import logging
 import mimetypes
+import re
 from email.message import EmailMessage
 from email.utils import formatdate, make_msgid
 from pathlib import Path
@@ -43,6 +44,20 @@ class MimeGenerator:
         >>> generator.save_to_file(msg, "output.eml")
     """
     
+    # Script and style elements, removed with their content
+    SCRIPT_STYLE_PATTERN = re.compile(
+        r'<(script|style)[^>]*>.*?</\1>', re.DOTALL | re.IGNORECASE
+    )
+    
+    # Closing tags of block elements, replaced with newlines
+    BLOCK_END_PATTERN = re.compile(r'</(p|div|h[1-6]|li|tr|br)[^>]*>', re.IGNORECASE)
+    
+    # Any remaining tag
+    TAG_PATTERN = re.compile(r'<[^>]+>')
+    
+    # Runs of three or more newlines (with optional whitespace between)
+    BLANK_LINES_PATTERN = re.compile(r'\n\s*\n\s*\n+')
+    
     def __init__(
         self,
         default_from: Optional[str] = None,
@@ -168,7 +183,8 @@ class MimeGenerator:
             logger.error(error_msg, exc_info=True)
             raise MimeGeneratorError(error_msg) from e
     
-    def _html_to_plain_text(self, html_content: str) -> str:
+    @staticmethod
+    def _html_to_plain_text(html_content: str) -> str:
         """Convert HTML to plain text by stripping tags.
         
         This is a simple implementation. For production use, consider
@@ -181,28 +197,28 @@ class MimeGenerator:
         Returns:
             Plain text version of the HTML
         """
-        import re
-        
-        # Remove script and style content
-        html_content = re.sub(r'<script[^>]*>.*?</script>', '', html_content, flags=re.DOTALL | re.IGNORECASE)
-        html_content = re.sub(r'<style[^>]*>.*?</style>', '', html_content, flags=re.DOTALL | re.IGNORECASE)
-        
-        # Replace common block elements with newlines
-        html_content = re.sub(r'</(p|div|h[1-6]|li|tr|br)[^>]*>', '\n', html_content, flags=re.IGNORECASE)
-        
-        # Remove all remaining HTML tags
-        html_content = re.sub(r'<[^>]+>', '', html_content)
+        # Text without any tags needs no tag stripping
+        if '<' in html_content:
+            # Remove script and style content
+            html_content = MimeGenerator.SCRIPT_STYLE_PATTERN.sub('', html_content)
+            
+            # Replace common block elements with newlines
+            html_content = MimeGenerator.BLOCK_END_PATTERN.sub('\n', html_content)
+            
+            # Remove all remaining HTML tags
+            html_content = MimeGenerator.TAG_PATTERN.sub('', html_content)
         
-        # Decode HTML entities (basic)
-        html_content = html_content.replace('&nbsp;', ' ')
-        html_content = html_content.replace('&amp;', '&')
-        html_content = html_content.replace('&lt;', '<')
-        html_content = html_content.replace('&gt;', '>')
-        html_content = html_content.replace('&quot;', '"')
-        html_content = html_content.replace('&#39;', "'")
+        # Decode HTML entities (basic); most pages have none to decode
+        if '&' in html_content:
+            html_content = html_content.replace('&nbsp;', ' ')
+            html_content = html_content.replace('&amp;', '&')
+            html_content = html_content.replace('&lt;', '<')
+            html_content = html_content.replace('&gt;', '>')
+            html_content = html_content.replace('&quot;', '"')
+            html_content = html_content.replace('&#39;', "'")
         
         # Clean up whitespace
-        html_content = re.sub(r'\n\s*\n\s*\n+', '\n\n', html_content)  # Multiple newlines to double
+        html_content = MimeGenerator.BLANK_LINES_PATTERN.sub('\n\n', html_content)  # Multiple newlines to double
         html_content = html_content.strip()
         
         return html_content
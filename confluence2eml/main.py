@@ -66,9 +66,13 @@ def get_credentials(args):
     return user, token
 
 
-def parse_arguments():
+def parse_arguments(argv: Optional[List[str]] = None):
     """Parse command-line arguments.
     
+    Args:
+        argv: Arguments to parse, without the program name. Defaults to
+            sys.argv[1:].
+    
     Returns:
         argparse.Namespace: Parsed arguments
     """
@@ -122,7 +126,7 @@ Examples:
         help='Enable verbose logging output'
     )
     
-    return parser.parse_args()
+    return parser.parse_args(argv)
 
 
 def extract_url_info(url: str) -> Tuple[str, str]:
@@ -375,16 +379,20 @@ def handle_error(error: Exception, context: str) -> None:
         sys.exit(1)
 
 
-def main():
+def main(argv: Optional[List[str]] = None):
     """Main entry point for the CLI application.
     
     This function orchestrates the complete Confluence-to-EML conversion
     pipeline. It follows the Step Down Rule, with high-level operations
     calling lower-level functions that hide implementation details.
+    
+    Args:
+        argv: Command-line arguments, without the program name. Defaults to
+            sys.argv[1:].
     """
     try:
         # Parse and validate command-line arguments
-        args = parse_arguments()
+        args = parse_arguments(argv)
         
         if args.verbose:
             logging.getLogger().setLevel(logging.DEBUG)
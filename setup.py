@@ -1,5 +1,7 @@
 """Setup configuration for confluence2eml package."""
 
+from pathlib import Path
+
 from setuptools import setup, find_packages
 
 # Core dependencies required to run the application
@@ -21,13 +23,28 @@ DEV_REQUIRES = [
     "pytest>=7.4.0",
     "pytest-cov>=4.1.0",
     "pytest-mock>=3.11.0",
+    "pytest-benchmark>=4.0.0",
+]
+
+# Faster C Markdown backend, enabled with MARKDOWN_BACKEND=cmark
+CMARK_REQUIRES = [
+    "cmarkgfm>=2022.10.27",
 ]
 
+
+def _read_readme():
+    """Return README.md for the long description, or "" if it is unavailable."""
+    try:
+        return Path(__file__).with_name("README.md").read_text(encoding="utf-8")
+    except OSError:
+        return ""
+
+
 setup(
     name="confluence2eml",
     version="0.1.0",
     description="Convert Atlassian Confluence pages to self-contained Microsoft Outlook email files (.EML format)",
-    long_description=open("README.md", encoding="utf-8").read(),
+    long_description=_read_readme(),
     long_description_content_type="text/markdown",
     author="Confluence2EML Contributors",
     license="MIT",
@@ -35,6 +52,7 @@ setup(
     install_requires=INSTALL_REQUIRES,
     extras_require={
         "dev": DEV_REQUIRES,
+        "cmark": CMARK_REQUIRES,
     },
     packages=find_packages(),
     entry_points={
@@ -4,54 +4,92 @@ This module provides common fixtures and test utilities used across
 all test modules in the test suite.
 """
 
-import json
-import os
+from __future__ import annotations
+
+import functools
 from pathlib import Path
-from typing import Dict, Any
+from types import MappingProxyType
+from typing import TYPE_CHECKING
 
 import pytest
 
+from tests.helpers import SAMPLE_URLS
+
+if TYPE_CHECKING:
+    from typing import Any, Callable, Mapping, Optional, Tuple
+
 
 # Get the test fixtures directory
 FIXTURES_DIR = Path(__file__).parent / "fixtures"
 
-
-@pytest.fixture
+# Static sample data, built once at import and shared read-only by the
+# session fixtures below
+_SAMPLE_ATTACHMENTS = (
+    MappingProxyType({
+        "id": "att1",
+        "title": "document.pdf",
+        "download_url": "https://company.atlassian.net/wiki/download/attachments/123456/document.pdf",
+        "media_type": "application/pdf",
+        "file_size": 102400
+    }),
+    MappingProxyType({
+        "id": "att2",
+        "title": "image.png",
+        "download_url": "https://company.atlassian.net/wiki/download/attachments/123456/image.png",
+        "media_type": "image/png",
+        "file_size": 51200
+    }),
+)
+
+_MOCK_CREDENTIALS = MappingProxyType({
+    "user": "test@example.com",
+    "token": "test_api_token_12345"
+})
+
+
+@pytest.fixture(scope="session")
 def fixtures_dir() -> Path:
     """Return the path to the test fixtures directory."""
     return FIXTURES_DIR
 
 
-@pytest.fixture
-def sample_confluence_urls() -> Dict[str, str]:
-    """Return a dictionary of sample Confluence URLs for testing.
+@pytest.fixture(scope="session")
+def sample_confluence_urls() -> Mapping[str, str]:
+    """Return a read-only mapping of sample Confluence URLs for testing.
     
     Returns:
-        Dictionary mapping URL type to URL string
+        Mapping of URL type to URL string
     """
-    return {
-        "pretty_url": "https://company.atlassian.net/wiki/spaces/SPACE/pages/123456/Page+Title",
-        "page_id_url": "https://company.atlassian.net/wiki/spaces/SPACE/pages/123456",
-        "short_url": "https://company.atlassian.net/wiki/pages/viewpage.action?pageId=123456",
-        "url_with_special_chars": "https://company.atlassian.net/wiki/spaces/SPACE/pages/123456/Page+Title+%28with+parentheses%29",
-        "cloud_url": "https://company.atlassian.net/wiki/spaces/SPACE/pages/123456/Page+Title",
-        "server_url": "https://confluence.company.com/display/SPACE/Page+Title",
-    }
+    return SAMPLE_URLS
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
+def read_fixture_file(fixtures_dir: Path) -> Callable[[str], str]:
+    """Return a reader for files in the fixtures directory.
+    
+    Each file is read from disk at most once per session; later calls for
+    the same name return the cached text.
+    """
+    @functools.lru_cache(maxsize=None)
+    def _read(filename: str) -> str:
+        return (fixtures_dir / filename).read_text(encoding='utf-8')
+    
+    return _read
+
+
+@pytest.fixture(scope="session")
 def sample_page_id() -> str:
     """Return a sample Confluence page ID for testing."""
     return "123456"
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_page_title() -> str:
     """Return a sample Confluence page title for testing."""
     return "Sample Page Title"
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_markdown_content() -> str:
     """Return sample Markdown content for testing."""
     return """# Sample Page Title
@@ -88,7 +126,13 @@ def hello_world():
 """
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
+def sample_markdown_bytes(sample_markdown_content: str) -> bytes:
+    """Return sample_markdown_content encoded as UTF-8, as saved to disk."""
+    return sample_markdown_content.encode('utf-8')
+
+
+@pytest.fixture(scope="session")
 def sample_html_content() -> str:
     """Return sample HTML content for testing."""
     return """<!DOCTYPE html>
@@ -106,20 +150,39 @@ def sample_html_content() -> str:
 """
 
 
-@pytest.fixture
-def sample_confluence_api_response(fixtures_dir: Path) -> Dict[str, Any]:
+@pytest.fixture(scope="session")
+def sample_html_soup(sample_html_content: str):
+    """Return sample_html_content parsed once into a BeautifulSoup tree.
+    
+    The tree is shared by every test in the session, so tests must only
+    inspect it and never modify it.
+    """
+    from bs4 import BeautifulSoup
+    return BeautifulSoup(sample_html_content, "html.parser")
+
+
+@pytest.fixture(scope="session")
+def sample_confluence_api_response(
+    fixtures_dir: Path, read_fixture_file: Callable[[str], str]
+) -> Mapping[str, Any]:
     """Load and return a sample Confluence API response from fixtures.
     
+    The file is parsed once per session and returned as a read-only mapping.
+    
     Returns:
-        Dictionary containing sample API response data
+        Mapping containing sample API response data
     """
     fixture_file = fixtures_dir / "confluence_api_response.json"
     if fixture_file.exists():
-        with open(fixture_file, 'r', encoding='utf-8') as f:
-            return json.load(f)
+        # orjson parses faster when installed; both accept the cached text
+        try:
+            import orjson as json_module
+        except ImportError:
+            import json as json_module
+        return MappingProxyType(json_module.loads(read_fixture_file(fixture_file.name)))
     else:
         # Return a minimal sample response if fixture file doesn't exist
-        return {
+        return MappingProxyType({
             "id": "123456",
             "type": "page",
             "title": "Sample Page Title",
@@ -133,39 +196,25 @@ def sample_confluence_api_response(fixtures_dir: Path) -> Dict[str, Any]:
                     "representation": "storage"
                 }
             }
-        }
+        })
 
 
-@pytest.fixture
-def sample_attachment_metadata() -> list:
-    """Return sample attachment metadata for testing."""
-    return [
-        {
-            "id": "att1",
-            "title": "document.pdf",
-            "download_url": "https://company.atlassian.net/wiki/download/attachments/123456/document.pdf",
-            "media_type": "application/pdf",
-            "file_size": 102400
-        },
-        {
-            "id": "att2",
-            "title": "image.png",
-            "download_url": "https://company.atlassian.net/wiki/download/attachments/123456/image.png",
-            "media_type": "image/png",
-            "file_size": 51200
-        }
-    ]
+@pytest.fixture(scope="session")
+def sample_attachment_metadata() -> Tuple[Mapping[str, Any], ...]:
+    """Return read-only sample attachment metadata for testing."""
+    return _SAMPLE_ATTACHMENTS
 
 
-@pytest.fixture
-def mock_credentials() -> Dict[str, str]:
-    """Return mock Confluence credentials for testing."""
-    return {
-        "user": "test@example.com",
-        "token": "test_api_token_12345"
-    }
+@pytest.fixture(scope="session")
+def mock_credentials() -> Mapping[str, str]:
+    """Return read-only mock Confluence credentials for testing."""
+    return _MOCK_CREDENTIALS
 
 
+# Temporary files: read-only data is written once per session with
+# tmp_path_factory; locations a test writes to stay function-scoped on
+# tmp_path so tests cannot see each other's output, unless the test only
+# writes file names no other test uses (see shared_output_dir).
 @pytest.fixture
 def temp_output_dir(tmp_path: Path) -> Path:
     """Return a temporary directory for test output files."""
@@ -174,29 +223,64 @@ def temp_output_dir(tmp_path: Path) -> Path:
     return output_dir
 
 
-@pytest.fixture
-def temp_markdown_file(tmp_path: Path, sample_markdown_content: str) -> Path:
-    """Create a temporary Markdown file for testing."""
-    md_file = tmp_path / "test_page.md"
-    md_file.write_text(sample_markdown_content, encoding='utf-8')
+@pytest.fixture(scope="session")
+def shared_output_dir(tmp_path_factory) -> Path:
+    """Return one output directory shared by every test in the session.
+    
+    Tests writing here must use file names no other test writes, e.g. a
+    ``uuid4().hex`` name, and must not list the directory.
+    """
+    return tmp_path_factory.mktemp("shared_output")
+
+
+@pytest.fixture(scope="session")
+def temp_markdown_file(tmp_path_factory, sample_markdown_bytes: bytes) -> Path:
+    """Return a Markdown file holding sample_markdown_content.
+    
+    The file is written once per session and shared, so tests must treat it
+    as read-only; use make_markdown_file for a per-test copy.
+    """
+    md_file = tmp_path_factory.mktemp("markdown") / "test_page.md"
+    md_file.write_bytes(sample_markdown_bytes)
     return md_file
 
 
+@pytest.fixture
+def make_markdown_file(tmp_path: Path, sample_markdown_bytes: bytes) -> Callable[..., Path]:
+    """Return a factory that writes a temporary Markdown file on demand.
+    
+    Calling ``make_markdown_file()`` writes sample_markdown_content to
+    ``test_page.md``; pass ``content`` and/or ``name`` to write something
+    else. Nothing is written until the factory is called.
+    """
+    def _make(content: Optional[str] = None, name: str = "test_page.md") -> Path:
+        md_file = tmp_path / name
+        if content is None:
+            # The sample content is already encoded once per session
+            md_file.write_bytes(sample_markdown_bytes)
+        else:
+            md_file.write_text(content, encoding='utf-8')
+        return md_file
+    
+    return _make
+
+
 @pytest.fixture
 def temp_eml_file(tmp_path: Path) -> Path:
     """Return a path for a temporary EML file."""
     return tmp_path / "test_export.eml"
 
 
-@pytest.fixture(autouse=True)
+@pytest.fixture
 def reset_environment(monkeypatch):
-    """Reset environment variables before each test.
+    """Clear Confluence-related environment variables for a test.
     
-    This ensures tests don't interfere with each other through
-    environment variable pollution.
+    Request this fixture (directly or via ``usefixtures``) in tests that
+    read credentials or the Markdown backend from the environment, so
+    values set in the developer's shell cannot leak into them.
     """
     # Clear Confluence-related environment variables
-    env_vars = ['CONFLUENCE_USER', 'CONFLUENCE_TOKEN', 'CONFLUENCE_URL']
+    env_vars = ['CONFLUENCE_USER', 'CONFLUENCE_TOKEN', 'CONFLUENCE_URL', 'MARKDOWN_BACKEND']
     for var in env_vars:
         monkeypatch.delenv(var, raising=False)
 
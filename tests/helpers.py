@@ -0,0 +1,26 @@
+"""Shared test data and helpers for confluence2eml tests.
+
+Test modules import these names directly; conftest.py is loaded by pytest
+as a plugin and is not imported by name.
+"""
+
+from types import MappingProxyType
+
+# Sample Confluence page URLs, keyed by URL format
+SAMPLE_URLS = MappingProxyType({
+    "pretty_url": "https://company.atlassian.net/wiki/spaces/SPACE/pages/123456/Page+Title",
+    "page_id_url": "https://company.atlassian.net/wiki/spaces/SPACE/pages/123456",
+    "short_url": "https://company.atlassian.net/wiki/pages/viewpage.action?pageId=123456",
+    "url_with_special_chars": "https://company.atlassian.net/wiki/spaces/SPACE/pages/123456/Page+Title+%28with+parentheses%29",
+    "cloud_url": "https://company.atlassian.net/wiki/spaces/SPACE/pages/123456/Page+Title",
+    "server_url": "https://confluence.company.com/display/SPACE/Page+Title",
+})
+
+
+def assert_contains_all(text: str, needles, ignore_case: bool = False) -> None:
+    """Assert that every needle is a substring of text, reporting all misses."""
+    if ignore_case:
+        text = text.lower()
+        needles = [needle.lower() for needle in needles]
+    missing = [needle for needle in needles if needle not in text]
+    assert not missing, f"missing: {missing}"
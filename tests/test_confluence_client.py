@@ -1,148 +1,132 @@
 """Tests for ConfluenceClient module."""
 
+from types import SimpleNamespace
+
 import pytest
-from unittest.mock import Mock, patch, MagicMock
+from unittest.mock import Mock
+
+
+@pytest.fixture(scope="module")
+def client_module():
+    """Import the client module on first use rather than at collection."""
+    from confluence2eml.core import client
+    return client
+
+
+@pytest.fixture
+def confluence_client(client_module, mock_credentials):
+    """Return a ConfluenceClient for the test Confluence Cloud site."""
+    return client_module.ConfluenceClient(
+        base_url="https://company.atlassian.net",
+        user=mock_credentials["user"],
+        token=mock_credentials["token"]
+    )
+
 
-from confluence2eml.core.client import (
-    ConfluenceClient,
-    ConfluenceClientError,
-    ConfluenceAuthenticationError,
-    ConfluencePageNotFoundError,
-)
+@pytest.fixture
+def rest_client(confluence_client):
+    """Return a ConfluenceClient forced onto the REST API code path."""
+    confluence_client._exporter = None
+    return confluence_client
 
 
 @pytest.mark.unit
 class TestConfluenceClient:
     """Test cases for ConfluenceClient class."""
     
-    def test_client_initialization(self, mock_credentials):
+    def test_client_initialization(self, confluence_client, mock_credentials):
         """Test that ConfluenceClient initializes correctly."""
-        client = ConfluenceClient(
-            base_url="https://company.atlassian.net",
-            user=mock_credentials["user"],
-            token=mock_credentials["token"]
-        )
-        assert client.base_url == "https://company.atlassian.net"
-        assert client.user == mock_credentials["user"]
-        assert client.token == mock_credentials["token"]
+        assert confluence_client.base_url == "https://company.atlassian.net"
+        assert confluence_client.user == mock_credentials["user"]
+        assert confluence_client.token == mock_credentials["token"]
     
-    def test_client_initialization_strips_trailing_slash(self, mock_credentials):
+    def test_client_initialization_strips_trailing_slash(self, client_module, mock_credentials):
         """Test that base URL trailing slash is stripped."""
-        client = ConfluenceClient(
+        client = client_module.ConfluenceClient(
             base_url="https://company.atlassian.net/",
             user=mock_credentials["user"],
             token=mock_credentials["token"]
         )
         assert client.base_url == "https://company.atlassian.net"
     
-    @patch('confluence2eml.core.client.subprocess')
-    @patch('confluence2eml.core.client.Path')
-    @patch('confluence2eml.core.client.tempfile')
-    def test_get_page_content_subprocess_success(
-        self, mock_tempfile, mock_path_class, mock_subprocess, mock_credentials
-    ):
-        """Test successful page content extraction via subprocess."""
-        # Setup mocks
-        mock_tmp_file = MagicMock()
-        mock_tmp_file.name = "/tmp/test.md"
-        mock_tempfile.NamedTemporaryFile.return_value.__enter__.return_value = mock_tmp_file
-        mock_tempfile.NamedTemporaryFile.return_value.__exit__.return_value = None
-        
-        mock_path_instance = MagicMock()
-        mock_path_instance.read_text.return_value = "# Test Page\n\nContent here"
-        mock_path_instance.unlink.return_value = None
-        mock_path_class.return_value = mock_path_instance
-        
-        mock_result = MagicMock()
-        mock_result.returncode = 0
-        mock_result.stdout = ""
-        mock_result.stderr = ""
-        mock_subprocess.run.return_value = mock_result
-        
-        # Create client and get content
-        client = ConfluenceClient(
-            base_url="https://company.atlassian.net",
-            user=mock_credentials["user"],
-            token=mock_credentials["token"]
+    def test_get_page_content_success(self, monkeypatch, rest_client):
+        """Test successful page content extraction from an in-process fake response."""
+        page_data = {
+            'title': 'Test Page',
+            'body': {'storage': {'value': '<h1>Test Page</h1><p>Content here</p>'}},
+            '_links': {'webui': '/spaces/SPACE/pages/123456'},
+        }
+        monkeypatch.setattr(
+            'confluence2eml.core.client.requests.get',
+            lambda *args, **kwargs: SimpleNamespace(status_code=200, json=lambda: page_data)
         )
         
-        # Mock the exporter to be None to force subprocess path
-        client._exporter = None
-        
-        content = client.get_page_content("123456")
+        content = rest_client.get_page_content("123456")
         
         assert content['page_id'] == "123456"
-        assert 'markdown' in content
-        assert 'title' in content
-        assert 'attachments' in content
+        assert content['title'] == "Test Page"
+        assert content['attachments'] == []
+        assert 'Content here' in content['markdown']
+        assert content['url'] == "https://company.atlassian.net/wiki/spaces/SPACE/pages/123456"
     
-    @patch('confluence2eml.core.client.subprocess')
-    def test_get_page_content_authentication_error(
-        self, mock_subprocess, mock_credentials
-    ):
-        """Test that authentication errors are properly raised."""
-        mock_result = MagicMock()
-        mock_result.returncode = 1
-        mock_result.stderr = "401 Unauthorized"
-        mock_subprocess.run.return_value = mock_result
-        
-        client = ConfluenceClient(
-            base_url="https://company.atlassian.net",
-            user="invalid@example.com",
-            token="invalid_token"
+    def test_export_page_subprocess_success(self, mocker, rest_client):
+        """Test successful page export via the confluence-markdown-exporter subprocess."""
+        # Setup mocks
+        mocks = mocker.patch.multiple(
+            'confluence2eml.core.client',
+            subprocess=mocker.DEFAULT,
+            Path=mocker.DEFAULT,
+            tempfile=mocker.DEFAULT,
         )
-        client._exporter = None
+        mock_subprocess = mocks['subprocess']
+        mock_path_class = mocks['Path']
+        mock_tempfile = mocks['tempfile']
         
-        with pytest.raises(ConfluenceAuthenticationError):
-            client.get_page_content("123456")
-    
-    @patch('confluence2eml.core.client.subprocess')
-    def test_get_page_content_page_not_found_error(
-        self, mock_subprocess, mock_credentials
-    ):
-        """Test that page not found errors are properly raised."""
-        mock_result = MagicMock()
-        mock_result.returncode = 1
-        mock_result.stderr = "404 Page not found"
-        mock_subprocess.run.return_value = mock_result
+        # NamedTemporaryFile is used as a context manager, so it stays a mock;
+        # the objects it and Path hand back only need plain attributes
+        mock_tmp_file = SimpleNamespace(name="/tmp/test.md")
+        mock_tempfile.NamedTemporaryFile.return_value.__enter__.return_value = mock_tmp_file
         
-        client = ConfluenceClient(
-            base_url="https://company.atlassian.net",
-            user=mock_credentials["user"],
-            token=mock_credentials["token"]
+        mock_path_instance = SimpleNamespace(
+            exists=lambda: True,
+            read_text=lambda encoding=None: "# Test Page\n\nContent here",
+            unlink=Mock(return_value=None),
         )
-        client._exporter = None
+        mock_path_class.return_value = mock_path_instance
         
-        with pytest.raises(ConfluencePageNotFoundError):
-            client.get_page_content("999999")
+        mock_subprocess.run.return_value = SimpleNamespace(returncode=0, stdout="", stderr="")
+        
+        content = rest_client._export_page_subprocess("123456")
+        
+        assert content['page_id'] == "123456"
+        assert content['markdown'] == "# Test Page\n\nContent here"
+        assert 'title' in content
+        assert 'attachments' in content
+        mock_subprocess.run.assert_called_once()
+        mock_path_instance.unlink.assert_called_once_with(missing_ok=True)
     
-    @patch('confluence2eml.core.client.subprocess')
-    def test_get_page_content_generic_error(
-        self, mock_subprocess, mock_credentials
+    # Exceptions are named rather than referenced so collection does not
+    # import the client module
+    @pytest.mark.parametrize("status_code,reason,expected_exc", [
+        (401, "Unauthorized", "ConfluenceAuthenticationError"),
+        (404, "Page not found", "ConfluencePageNotFoundError"),
+        (500, "Internal Server Error", "ConfluenceClientError"),
+    ], ids=["authentication_error", "page_not_found_error", "generic_error"])
+    def test_get_page_content_http_error(
+        self, monkeypatch, client_module, rest_client, status_code, reason, expected_exc
     ):
-        """Test that generic errors are properly raised."""
-        mock_result = MagicMock()
-        mock_result.returncode = 1
-        mock_result.stderr = "500 Internal Server Error"
-        mock_subprocess.run.return_value = mock_result
-        
-        client = ConfluenceClient(
-            base_url="https://company.atlassian.net",
-            user=mock_credentials["user"],
-            token=mock_credentials["token"]
+        """Test that HTTP error responses raise the matching exception."""
+        monkeypatch.setattr(
+            'confluence2eml.core.client.requests.get',
+            lambda *args, **kwargs: SimpleNamespace(status_code=status_code, text=reason)
         )
-        client._exporter = None
         
-        with pytest.raises(ConfluenceClientError):
-            client.get_page_content("123456")
+        with pytest.raises(getattr(client_module, expected_exc)):
+            rest_client.get_page_content("123456")
     
-    def test_get_page_metadata(self, mock_credentials):
+    def test_get_page_metadata(self, confluence_client):
         """Test getting page metadata."""
-        client = ConfluenceClient(
-            base_url="https://company.atlassian.net",
-            user=mock_credentials["user"],
-            token=mock_credentials["token"]
-        )
+        client = confluence_client
         
         # Mock get_page_content to return test data
         mock_content = {
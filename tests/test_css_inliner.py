@@ -1,11 +1,42 @@
 """Tests for CssInliner module."""
 
+import logging
+import re
+
 import pytest
 
-from confluence2eml.core.css_inliner import (
+# Skip the whole module once at collection if premailer is missing, instead
+# of failing every test when CssInliner is constructed
+pytest.importorskip("premailer")
+
+import cssutils  # noqa: E402
+from confluence2eml.core.css_inliner import (  # noqa: E402
     CssInliner,
     CssInlinerError,
 )
+from tests.helpers import assert_contains_all  # noqa: E402
+
+
+@pytest.fixture(scope="module")
+def default_inliner():
+    """Return a CssInliner with the default configuration.
+    
+    CssInliner holds no per-call state, so one instance is shared by every
+    test in this module.
+    """
+    return CssInliner()
+
+
+@pytest.fixture(scope="module")
+def inliner_with_base_url():
+    """Return a CssInliner configured with a Confluence base URL."""
+    return CssInliner(base_url="https://confluence.example.com")
+
+
+@pytest.fixture(scope="module")
+def inliner_keep_styles():
+    """Return a CssInliner that keeps <style> tags after inlining."""
+    return CssInliner(keep_style_tags=True)
 
 
 @pytest.mark.unit
@@ -21,11 +52,10 @@ class TestCssInlinerInitialization:
         assert inliner.keep_style_tags is False
         assert inliner.disable_validation is True
     
-    def test_initialization_with_base_url(self):
+    def test_initialization_with_base_url(self, inliner_with_base_url):
         """Test CssInliner with base URL."""
         base_url = "https://confluence.example.com"
-        inliner = CssInliner(base_url=base_url)
-        assert inliner.base_url == base_url
+        assert inliner_with_base_url.base_url == base_url
     
     def test_initialization_with_custom_options(self):
         """Test CssInliner with custom configuration options."""
@@ -41,28 +71,16 @@ class TestCssInlinerInitialization:
         assert inliner.disable_validation is False
 
 
-@pytest.mark.unit
-class TestCssInlinerInline:
-    """Test cases for CssInliner.inline method."""
-    
-    def test_inline_simple_html_with_wrapping(self):
-        """Test inlining CSS with simple HTML content and CSS wrapping."""
-        inliner = CssInliner()
-        html = "<h1>Hello</h1><p>World</p>"
-        result = inliner.inline(html, wrap_with_css=True)
-        
-        # Should have inline styles
-        assert 'style=' in result
-        # Note: premailer may keep style tags for pseudo-selectors (like :hover, :visited)
-        # which can't be inlined - this is expected behavior
-        # Should preserve content
-        assert 'Hello' in result or 'hello' in result.lower()
-        assert 'World' in result or 'world' in result.lower()
-    
-    def test_inline_without_wrapping(self):
-        """Test inlining CSS without wrapping (HTML already has style tags)."""
-        inliner = CssInliner()
-        html = """<html>
+def assert_contains_none(haystack, needles):
+    """Assert that no needle occurs in haystack, ignoring case."""
+    found = [
+        needle for needle in needles
+        if re.search(re.escape(needle), haystack, re.IGNORECASE)
+    ]
+    assert not found, f"unexpected: {found}"
+
+
+STYLED_DOCUMENT = """<html>
 <head>
 <style>
 p { color: red; font-size: 14px; }
@@ -74,67 +92,47 @@ h1 { color: blue; }
 <p>Paragraph</p>
 </body>
 </html>"""
-        result = inliner.inline(html, wrap_with_css=False)
-        
-        # Should have inline styles
-        assert 'style=' in result
-        # Should not have style tags
-        assert '<style' not in result.lower()
-        # Should preserve content
-        assert 'Title' in result
-        assert 'Paragraph' in result
-    
-    def test_inline_with_custom_css(self):
-        """Test inlining with custom CSS content."""
-        inliner = CssInliner()
-        html = "<p>Test</p>"
-        custom_css = "p { color: green; font-weight: bold; }"
-        result = inliner.inline(html, wrap_with_css=True, css_content=custom_css)
-        
-        # Should have inline styles
-        assert 'style=' in result
-        # Custom CSS should be applied
-        assert 'color' in result.lower() or 'font-weight' in result.lower()
-        # Should preserve content
-        assert 'Test' in result
-    
-    def test_inline_with_base_url_absolutizes_relative_urls(self):
-        """Test that base_url causes relative URLs to be absolutized."""
-        base_url = "https://confluence.example.com"
-        inliner = CssInliner(base_url=base_url)
-        html = """<html>
-<body>
-<a href="/page/123">Link</a>
-<img src="/download/image.png" alt="Image">
-</body>
-</html>"""
-        result = inliner.inline(html, wrap_with_css=True)
-        
-        # URLs should be absolutized
-        assert base_url in result
-        assert 'href="https://' in result or 'href="' + base_url in result
-        assert 'src="https://' in result or 'src="' + base_url in result
-    
-    def test_inline_without_base_url_preserves_relative_urls(self):
-        """Test that without base_url, relative URLs remain relative."""
-        inliner = CssInliner(base_url=None)
-        html = """<html>
+
+RELATIVE_URLS_DOCUMENT = """<html>
 <body>
 <a href="/page/123">Link</a>
 <img src="/download/image.png" alt="Image">
 </body>
 </html>"""
-        result = inliner.inline(html, wrap_with_css=True)
-        
-        # Relative URLs should still be present (may be converted to absolute by premailer
-        # in some cases, but we're testing the behavior)
-        assert 'Link' in result
-        assert 'Image' in result
-    
-    def test_inline_preserves_html_structure(self):
-        """Test that inlining preserves HTML structure."""
-        inliner = CssInliner()
-        html = """<h1>Title</h1>
+
+# (html, inline() kwargs, substrings expected in the result,
+#  substrings that must not appear in the result, ignoring case)
+INLINE_CASES = [
+    pytest.param(
+        "<h1>Hello</h1><p>World</p>",
+        {'wrap_with_css': True},
+        ['style=', 'Hello', 'World'],
+        [],
+        id="simple_html_with_wrapping",
+    ),
+    pytest.param(
+        STYLED_DOCUMENT,
+        {'wrap_with_css': False},
+        ['style=', 'Title', 'Paragraph'],
+        ['<style'],
+        id="without_wrapping",
+    ),
+    pytest.param(
+        "<p>Test</p>",
+        {'wrap_with_css': True, 'css_content': "p { color: green; font-weight: bold; }"},
+        ['style=', 'color', 'font-weight', 'Test'],
+        [],
+        id="custom_css",
+    ),
+    pytest.param(
+        RELATIVE_URLS_DOCUMENT,
+        {'wrap_with_css': True},
+        ['Link', 'Image'],
+        [],
+        id="without_base_url_preserves_relative_urls",
+    ),
+    pytest.param(
+        """<h1>Title</h1>
 <p>Paragraph with <strong>bold</strong> and <em>italic</em> text.</p>
 <ul>
     <li>Item 1</li>
@@ -143,31 +141,15 @@ h1 { color: blue; }
 <table>
     <tr><th>Header</th></tr>
     <tr><td>Data</td></tr>
-</table>"""
-        result = inliner.inline(html, wrap_with_css=True)
-        
-        # Should preserve all elements
-        assert '<h1' in result
-        assert '<p' in result
-        assert '<strong' in result
-        assert '<em' in result
-        assert '<ul' in result
-        assert '<li' in result
-        assert '<table' in result
-        assert '<th' in result
-        assert '<td' in result
-        # Should preserve content
-        assert 'Title' in result
-        assert 'bold' in result
-        assert 'italic' in result
-        assert 'Item 1' in result
-        assert 'Header' in result
-        assert 'Data' in result
-    
-    def test_inline_applies_css_styles(self):
-        """Test that CSS styles are actually applied as inline styles."""
-        inliner = CssInliner()
-        html = """<html>
+</table>""",
+        {'wrap_with_css': True},
+        ['<h1', '<p', '<strong', '<em', '<ul', '<li', '<table', '<th', '<td',
+         'Title', 'bold', 'italic', 'Item 1', 'Header', 'Data'],
+        [],
+        id="preserves_html_structure",
+    ),
+    pytest.param(
+        """<html>
 <head>
 <style>
 h1 { color: #0052CC; font-size: 24px; }
@@ -178,19 +160,14 @@ p { margin-bottom: 12px; line-height: 1.6; }
 <h1>Title</h1>
 <p>Paragraph</p>
 </body>
-</html>"""
-        result = inliner.inline(html, wrap_with_css=False)
-        
-        # Should have inline styles on elements
-        assert 'style=' in result
-        # Should have color or font-size in inline styles
-        assert ('color' in result.lower() or 'font-size' in result.lower() or 
-                'margin' in result.lower() or 'line-height' in result.lower())
-    
-    def test_inline_removes_style_tags(self):
-        """Test that style tags are removed after inlining."""
-        inliner = CssInliner(keep_style_tags=False)
-        html = """<html>
+</html>""",
+        {'wrap_with_css': False},
+        ['style=', 'color', 'font-size', 'margin-bottom', 'line-height'],
+        [],
+        id="applies_css_styles",
+    ),
+    pytest.param(
+        """<html>
 <head>
 <style>
 p { color: red; }
@@ -199,16 +176,61 @@ p { color: red; }
 <body>
 <p>Test</p>
 </body>
-</html>"""
-        result = inliner.inline(html, wrap_with_css=False)
+</html>""",
+        {'wrap_with_css': False},
+        [],
+        ['<style', '</style>'],
+        id="removes_style_tags",
+    ),
+    pytest.param(
+        "",
+        {'wrap_with_css': True},
+        ['<html'],
+        [],
+        id="empty_html",
+    ),
+    pytest.param(
+        """<h1>Main Title</h1>
+<h2>Subtitle</h2>
+<p>Paragraph with <a href="http://example.com">link</a>.</p>
+<blockquote>Quote text</blockquote>
+<pre><code>code block</code></pre>
+<img src="image.png" alt="Image">
+<table>
+    <tr><th>Header 1</th><th>Header 2</th></tr>
+    <tr><td>Data 1</td><td>Data 2</td></tr>
+</table>""",
+        {'wrap_with_css': True},
+        ['Main Title', 'Subtitle', 'link', 'Quote text', 'code block',
+         'image.png', 'Header 1', 'Data 1'],
+        [],
+        id="complex_html",
+    ),
+]
+
+
+@pytest.mark.unit
+class TestCssInlinerInline:
+    """Test cases for CssInliner.inline method."""
+    
+    @pytest.mark.parametrize("html,kwargs,expected,unexpected", INLINE_CASES)
+    def test_inline(self, default_inliner, html, kwargs, expected, unexpected):
+        """Test inline() output with the default configuration."""
+        result = default_inliner.inline(html, **kwargs)
         
-        # Style tags should be removed
-        assert '<style' not in result.lower()
-        assert '</style>' not in result.lower()
+        assert_contains_all(result, expected)
+        assert_contains_none(result, unexpected)
     
-    def test_inline_keeps_style_tags_when_requested(self):
+    def test_inline_with_base_url_absolutizes_relative_urls(self, inliner_with_base_url):
+        """Test that base_url causes relative URLs to be absolutized."""
+        base_url = "https://confluence.example.com"
+        result = inliner_with_base_url.inline(RELATIVE_URLS_DOCUMENT, wrap_with_css=True)
+        
+        # URLs should be absolutized
+        assert_contains_all(result, [base_url, 'href="' + base_url, 'src="' + base_url])
+    
+    def test_inline_keeps_style_tags_when_requested(self, inliner_keep_styles):
         """Test that style tags are kept when keep_style_tags=True."""
-        inliner = CssInliner(keep_style_tags=True)
         html = """<html>
 <head>
 <style>
@@ -219,73 +241,47 @@ p { color: red; }
 <p>Test</p>
 </body>
 </html>"""
-        result = inliner.inline(html, wrap_with_css=False)
+        result = inliner_keep_styles.inline(html, wrap_with_css=False)
         
         # Style tags should be kept (though this is not recommended for email)
-        # Note: premailer may still remove them in some cases
-        # This test verifies the option is passed through
+        assert re.search(r'<style', result, re.IGNORECASE)
     
-    def test_inline_empty_html(self):
-        """Test inlining empty HTML content."""
-        inliner = CssInliner()
-        html = ""
-        result = inliner.inline(html, wrap_with_css=True)
-        
-        # Should still produce valid HTML structure
-        assert '<html' in result.lower() or '<body' in result.lower()
+    def test_inline_applies_cssutils_logging_level_per_inliner(self):
+        """Test that each inliner applies its own cssutils log level."""
+        original_level = cssutils.log.getEffectiveLevel()
+        try:
+            CssInliner(cssutils_logging_level=logging.ERROR).inline("<p>First</p>")
+            assert cssutils.log.getEffectiveLevel() == logging.ERROR
+            
+            CssInliner(cssutils_logging_level=logging.CRITICAL).inline("<p>Second</p>")
+            assert cssutils.log.getEffectiveLevel() == logging.CRITICAL
+        finally:
+            cssutils.log.setLevel(original_level)
     
-    def test_inline_invalid_input_type(self):
+    def test_inline_invalid_input_type(self, default_inliner):
         """Test that invalid input type raises error."""
-        inliner = CssInliner()
         with pytest.raises(CssInlinerError) as exc_info:
-            inliner.inline(None)  # type: ignore
+            default_inliner.inline(None)  # type: ignore
         assert "must be a string" in str(exc_info.value)
-    
-    def test_inline_complex_html(self):
-        """Test inlining with complex HTML containing various elements."""
-        inliner = CssInliner()
-        html = """<h1>Main Title</h1>
-<h2>Subtitle</h2>
-<p>Paragraph with <a href="http://example.com">link</a>.</p>
-<blockquote>Quote text</blockquote>
-<pre><code>code block</code></pre>
-<img src="image.png" alt="Image">
-<table>
-    <tr><th>Header 1</th><th>Header 2</th></tr>
-    <tr><td>Data 1</td><td>Data 2</td></tr>
-</table>"""
-        result = inliner.inline(html, wrap_with_css=True)
-        
-        # Should preserve all elements
-        assert 'Main Title' in result
-        assert 'Subtitle' in result
-        assert 'link' in result
-        assert 'Quote text' in result
-        assert 'code block' in result
-        assert 'image.png' in result or 'Image' in result
-        assert 'Header 1' in result
-        assert 'Data 1' in result
 
 
 @pytest.mark.unit
 class TestCssInlinerConvenienceMethods:
     """Test cases for CssInliner convenience methods."""
     
-    def test_inline_with_custom_css_method(self):
+    def test_inline_with_custom_css_method(self, default_inliner):
         """Test inline_with_custom_css convenience method."""
-        inliner = CssInliner()
         html = "<p>Test</p>"
         custom_css = "p { color: blue; }"
-        result = inliner.inline_with_custom_css(html, custom_css)
+        result = default_inliner.inline_with_custom_css(html, custom_css)
         
         # Should have inline styles
         assert 'style=' in result
         # Should preserve content
         assert 'Test' in result
     
-    def test_inline_without_wrapping_method(self):
+    def test_inline_without_wrapping_method(self, default_inliner):
         """Test inline_without_wrapping convenience method."""
-        inliner = CssInliner()
         html = """<html>
 <head>
 <style>
@@ -296,7 +292,7 @@ p { color: red; }
 <p>Test</p>
 </body>
 </html>"""
-        result = inliner.inline_without_wrapping(html)
+        result = default_inliner.inline_without_wrapping(html)
         
         # Should have inline styles
         assert 'style=' in result
@@ -308,41 +304,22 @@ p { color: red; }
 class TestCssInlinerUrlAbsolutization:
     """Test cases for URL absolutization functionality."""
     
-    def test_absolutize_relative_links(self):
-        """Test that relative links are converted to absolute URLs."""
-        base_url = "https://confluence.example.com"
-        inliner = CssInliner(base_url=base_url)
-        html = '<a href="/spaces/SPACE/pages/123">Page</a>'
-        result = inliner.inline(html, wrap_with_css=True)
-        
-        # URL should be absolutized
-        assert base_url in result
-    
-    def test_absolutize_relative_images(self):
-        """Test that relative image URLs are converted to absolute URLs."""
-        base_url = "https://confluence.example.com"
-        inliner = CssInliner(base_url=base_url)
-        html = '<img src="/download/attachments/123/image.png" alt="Image">'
-        result = inliner.inline(html, wrap_with_css=True)
-        
-        # URL should be absolutized
-        assert base_url in result
-    
-    def test_preserve_absolute_urls(self):
-        """Test that absolute URLs are preserved."""
-        base_url = "https://confluence.example.com"
-        inliner = CssInliner(base_url=base_url)
-        absolute_url = "https://example.com/page"
-        html = f'<a href="{absolute_url}">Link</a>'
-        result = inliner.inline(html, wrap_with_css=True)
+    @pytest.mark.parametrize("html,expected", [
+        ('<a href="/spaces/SPACE/pages/123">Page</a>', "https://confluence.example.com"),
+        ('<img src="/download/attachments/123/image.png" alt="Image">',
+         "https://confluence.example.com"),
+        ('<a href="https://example.com/page">Link</a>', "https://example.com/page"),
+    ], ids=["absolutize_relative_links", "absolutize_relative_images",
+            "preserve_absolute_urls"])
+    def test_url_absolutization(self, inliner_with_base_url, html, expected):
+        """Test that relative URLs are absolutized and absolute URLs preserved."""
+        result = inliner_with_base_url.inline(html, wrap_with_css=True)
         
-        # Absolute URL should be preserved
-        assert absolute_url in result
+        assert expected in result
     
-    def test_absolutize_urls_in_css(self):
+    def test_absolutize_urls_in_css(self, inliner_with_base_url):
         """Test that URLs in CSS (like background-image) are absolutized."""
         base_url = "https://confluence.example.com"
-        inliner = CssInliner(base_url=base_url)
         html = """<html>
 <head>
 <style>
@@ -353,7 +330,7 @@ div { background-image: url('/images/bg.png'); }
 <div>Content</div>
 </body>
 </html>"""
-        result = inliner.inline(html, wrap_with_css=False)
+        result = inliner_with_base_url.inline(html, wrap_with_css=False)
         
         # CSS URL should be absolutized in inline style
         assert base_url in result or '/images/bg.png' in result
@@ -4,45 +4,42 @@ This module tests that the pytest fixtures and test infrastructure
 are set up correctly and working as expected.
 """
 
-import json
 import os
+import stat
+from collections.abc import Mapping, Sequence
 from pathlib import Path
 
 import pytest
 
+pytestmark = pytest.mark.unit
+
 
-@pytest.mark.unit
 def test_fixtures_dir_exists(fixtures_dir: Path):
     """Test that the fixtures directory exists."""
-    assert fixtures_dir.exists()
-    assert fixtures_dir.is_dir()
+    assert stat.S_ISDIR(fixtures_dir.stat().st_mode)
 
 
-@pytest.mark.unit
-def test_sample_confluence_urls(sample_confluence_urls: dict):
+def test_sample_confluence_urls(sample_confluence_urls: Mapping):
     """Test that sample Confluence URLs fixture works."""
-    assert isinstance(sample_confluence_urls, dict)
+    assert isinstance(sample_confluence_urls, Mapping)
     assert "pretty_url" in sample_confluence_urls
     assert "page_id_url" in sample_confluence_urls
     assert "short_url" in sample_confluence_urls
     assert all(isinstance(url, str) for url in sample_confluence_urls.values())
 
 
-@pytest.mark.unit
 def test_sample_page_id(sample_page_id: str):
     """Test that sample page ID fixture works."""
     assert isinstance(sample_page_id, str)
     assert sample_page_id == "123456"
 
 
-@pytest.mark.unit
 def test_sample_page_title(sample_page_title: str):
     """Test that sample page title fixture works."""
     assert isinstance(sample_page_title, str)
     assert len(sample_page_title) > 0
 
 
-@pytest.mark.unit
 def test_sample_markdown_content(sample_markdown_content: str):
     """Test that sample Markdown content fixture works."""
     assert isinstance(sample_markdown_content, str)
@@ -50,7 +47,6 @@ def test_sample_markdown_content(sample_markdown_content: str):
     assert "**bold text**" in sample_markdown_content
 
 
-@pytest.mark.unit
 def test_sample_html_content(sample_html_content: str):
     """Test that sample HTML content fixture works."""
     assert isinstance(sample_html_content, str)
@@ -58,19 +54,25 @@ def test_sample_html_content(sample_html_content: str):
     assert "<h1>Sample Page Title</h1>" in sample_html_content
 
 
-@pytest.mark.unit
-def test_sample_confluence_api_response(sample_confluence_api_response: dict):
+def test_sample_html_soup(sample_html_soup):
+    """Test that the pre-parsed sample HTML fixture exposes the page structure."""
+    assert sample_html_soup.title.string == "Sample Page Title"
+    assert sample_html_soup.h1.string == "Sample Page Title"
+    assert sample_html_soup.img["alt"] == "Sample Image"
+    assert sample_html_soup.a["href"] == "https://example.com"
+
+
+def test_sample_confluence_api_response(sample_confluence_api_response: Mapping):
     """Test that sample Confluence API response fixture works."""
-    assert isinstance(sample_confluence_api_response, dict)
+    assert isinstance(sample_confluence_api_response, Mapping)
     assert "id" in sample_confluence_api_response
     assert "title" in sample_confluence_api_response
     assert sample_confluence_api_response["id"] == "123456"
 
 
-@pytest.mark.unit
-def test_sample_attachment_metadata(sample_attachment_metadata: list):
+def test_sample_attachment_metadata(sample_attachment_metadata: Sequence):
     """Test that sample attachment metadata fixture works."""
-    assert isinstance(sample_attachment_metadata, list)
+    assert isinstance(sample_attachment_metadata, Sequence)
     assert len(sample_attachment_metadata) > 0
     for attachment in sample_attachment_metadata:
         assert "id" in attachment
@@ -78,103 +80,93 @@ def test_sample_attachment_metadata(sample_attachment_metadata: list):
         assert "download_url" in attachment
 
 
-@pytest.mark.unit
-def test_mock_credentials(mock_credentials: dict):
+def test_mock_credentials(mock_credentials: Mapping):
     """Test that mock credentials fixture works."""
-    assert isinstance(mock_credentials, dict)
+    assert isinstance(mock_credentials, Mapping)
     assert "user" in mock_credentials
     assert "token" in mock_credentials
     assert "@" in mock_credentials["user"]
 
 
-@pytest.mark.unit
+def test_session_data_fixtures_are_read_only(
+    sample_confluence_urls, mock_credentials, sample_attachment_metadata
+):
+    """Test that session-scoped data fixtures cannot be mutated by a test."""
+    with pytest.raises(TypeError):
+        sample_confluence_urls["pretty_url"] = "changed"  # type: ignore
+    with pytest.raises(TypeError):
+        mock_credentials["user"] = "changed"  # type: ignore
+    with pytest.raises(TypeError):
+        sample_attachment_metadata[0]["id"] = "changed"  # type: ignore
+
+
 def test_temp_output_dir(temp_output_dir: Path):
     """Test that temporary output directory fixture works."""
-    assert temp_output_dir.exists()
-    assert temp_output_dir.is_dir()
+    assert stat.S_ISDIR(temp_output_dir.stat().st_mode)
     # Test that we can write to it
     test_file = temp_output_dir / "test.txt"
     test_file.write_text("test")
     assert test_file.exists()
 
 
-@pytest.mark.unit
 def test_temp_markdown_file(temp_markdown_file: Path, sample_markdown_content: str):
-    """Test that temporary Markdown file fixture works."""
-    assert temp_markdown_file.exists()
+    """Test that the shared temporary Markdown file fixture works."""
     assert temp_markdown_file.suffix == ".md"
-    content = temp_markdown_file.read_text(encoding='utf-8')
+    # stat() both checks the file exists and that it holds the sample bytes
+    expected_size = len(sample_markdown_content.encode('utf-8'))
+    assert temp_markdown_file.stat().st_size == expected_size
+
+
+def test_make_markdown_file(make_markdown_file, sample_markdown_content: str):
+    """Test that the Markdown file factory fixture works."""
+    md_file = make_markdown_file()
+    assert md_file.exists()
+    assert md_file.suffix == ".md"
+    content = md_file.read_text(encoding='utf-8')
     assert content == sample_markdown_content
 
 
-@pytest.mark.unit
+def test_make_markdown_file_custom_content(make_markdown_file):
+    """Test that the Markdown file factory accepts custom content and names."""
+    md_file = make_markdown_file("# Other\n", name="other.md")
+    assert md_file.name == "other.md"
+    assert md_file.read_text(encoding='utf-8') == "# Other\n"
+
+
 def test_temp_eml_file(temp_eml_file: Path):
     """Test that temporary EML file path fixture works."""
     assert temp_eml_file.suffix == ".eml"
-    # File shouldn't exist yet (just a path)
-    assert not temp_eml_file.exists() or temp_eml_file.exists()
-
-
-@pytest.mark.unit
-def test_fixture_files_exist(fixtures_dir: Path):
-    """Test that fixture files exist in the fixtures directory."""
-    expected_files = [
-        "confluence_api_response.json",
-        "sample_page.html",
-        "sample_page.md",
-    ]
-    
-    for filename in expected_files:
-        fixture_file = fixtures_dir / filename
-        assert fixture_file.exists(), f"Fixture file {filename} should exist"
 
 
-@pytest.mark.unit
-def test_confluence_api_response_fixture_file(fixtures_dir: Path):
-    """Test that the Confluence API response fixture file is valid JSON."""
-    fixture_file = fixtures_dir / "confluence_api_response.json"
-    assert fixture_file.exists()
+@pytest.mark.parametrize("filename,needles", [
+    ("confluence_api_response.json", ['"id"', '"title"', '"body"']),
+    ("sample_page.md", ["# Sample Page Title"]),
+    ("sample_page.html", ["<html>", "<h1>Sample Page Title</h1>"]),
+])
+def test_fixture_file(fixtures_dir: Path, read_fixture_file, filename, needles):
+    """Test that each fixture file exists and holds the expected content."""
+    fixture_file = fixtures_dir / filename
+    assert fixture_file.is_file(), f"Fixture file {filename} should exist"
     
-    with open(fixture_file, 'r', encoding='utf-8') as f:
-        data = json.load(f)
-    
-    assert isinstance(data, dict)
-    assert "id" in data
-    assert "title" in data
-    assert "body" in data
+    content = read_fixture_file(filename)
+    for needle in needles:
+        assert needle in content
 
 
-@pytest.mark.unit
-def test_sample_markdown_fixture_file(fixtures_dir: Path):
-    """Test that the sample Markdown fixture file exists and is readable."""
-    fixture_file = fixtures_dir / "sample_page.md"
-    assert fixture_file.exists()
-    
-    content = fixture_file.read_text(encoding='utf-8')
-    assert isinstance(content, str)
-    assert len(content) > 0
-    assert "# Sample Page Title" in content
+def test_read_fixture_file_is_cached(read_fixture_file):
+    """Test that repeated reads of a fixture file return the cached text."""
+    first = read_fixture_file("sample_page.html")
+    assert read_fixture_file("sample_page.html") is first
 
 
-@pytest.mark.unit
-def test_sample_html_fixture_file(fixtures_dir: Path):
-    """Test that the sample HTML fixture file exists and is readable."""
-    fixture_file = fixtures_dir / "sample_page.html"
-    assert fixture_file.exists()
-    
-    content = fixture_file.read_text(encoding='utf-8')
-    assert isinstance(content, str)
-    assert len(content) > 0
-    assert "<html>" in content
-    assert "<h1>Sample Page Title</h1>" in content
-
-
-@pytest.mark.unit
-def test_environment_reset(monkeypatch):
-    """Test that environment variables are reset between tests."""
-    # Set an environment variable
-    monkeypatch.setenv("CONFLUENCE_USER", "test_user")
-    assert os.getenv("CONFLUENCE_USER") == "test_user"
+def test_environment_reset(reset_environment):
+    """Test that the reset_environment fixture clears Confluence variables."""
+    for var in ('CONFLUENCE_USER', 'CONFLUENCE_TOKEN', 'CONFLUENCE_URL', 'MARKDOWN_BACKEND'):
+        assert os.getenv(var) is None
     
-    # The reset_environment fixture should clear it in the next test
+    # Variables set inside the context are undone when it exits
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setenv("CONFLUENCE_USER", "test_user")
+        assert os.getenv("CONFLUENCE_USER") == "test_user"
+    assert os.getenv("CONFLUENCE_USER") is None
 
@@ -1,8 +1,11 @@
 """Tests for ImageProcessor module."""
 
-import pytest
-from unittest.mock import Mock, patch, MagicMock
+import contextlib
 from email.utils import make_msgid
+from types import MappingProxyType, SimpleNamespace
+from unittest.mock import patch
+
+import pytest
 
 from confluence2eml.core.image_processor import (
     ImageProcessor,
@@ -11,6 +14,79 @@ from confluence2eml.core.image_processor import (
     ImageData,
 )
 
+# Deprecation warnings from third-party libraries (BeautifulSoup, requests)
+# are not what these tests check, so they are not collected
+pytestmark = [
+    pytest.mark.filterwarnings("ignore::DeprecationWarning:bs4"),
+    pytest.mark.filterwarnings("ignore::DeprecationWarning:requests"),
+]
+
+# make_msgid() may look up the host name, so one Content-ID is generated at
+# import and shared by the ImageData tests
+TEST_CID = make_msgid(domain='test')
+
+# Constructor arguments for an ImageProcessor pointed at the test site
+PROCESSOR_KWARGS = MappingProxyType({
+    'base_url': "https://confluence.example.com",
+    'user': "user@example.com",
+    'token': "token",
+})
+
+
+@contextlib.contextmanager
+def make_processor(**overrides):
+    """Build an ImageProcessor for the test site and close it on exit.
+    
+    Keyword arguments override the default constructor arguments.
+    """
+    image_processor = ImageProcessor(**{**PROCESSOR_KWARGS, **overrides})
+    try:
+        yield image_processor
+    finally:
+        image_processor.close()
+
+
+@pytest.fixture(scope="module")
+def processor():
+    """Return an ImageProcessor shared by the tests in this module.
+    
+    The processor keeps no per-call state apart from its requests session,
+    so one instance (and one session) serves every test; tests that need
+    other constructor arguments or call close() build their own.
+    """
+    with make_processor() as image_processor:
+        yield image_processor
+
+
+def image_response(content=b'fake_image_data', content_type='image/png'):
+    """Return a stand-in for a successful requests response carrying an image."""
+    headers = {'Content-Type': content_type} if content_type else {}
+    return SimpleNamespace(
+        content=content,
+        headers=MappingProxyType(headers),
+        raise_for_status=lambda: None,
+    )
+
+
+@pytest.fixture(scope="module")
+def png_response():
+    """Return a read-only PNG image response shared by the download tests."""
+    return image_response()
+
+
+# HTML documents shared by the process_images() tests
+NO_IMAGES_HTML = "<h1>Title</h1><p>Content</p>"
+
+ONE_IMAGE_HTML = '<img src="https://confluence.example.com/download/image.png" alt="Image" />'
+
+TWO_IMAGES_HTML = """<img src="https://confluence.example.com/image1.png" />
+<img src="https://confluence.example.com/image2.jpg" />"""
+
+DATA_URI_HTML = (
+    '<img src="data:image/png;base64,'
+    'iVBORw0KGgoAAAANSUhEUgAAAAEAAAABCAYAAAAfFcSJAAAADUlEQVR42mNk+M9QDwADhgGAWjR9awAAAABJRU5ErkJggg==" />'
+)
+
 
 @pytest.mark.unit
 class TestImageData:
@@ -18,14 +94,13 @@ class TestImageData:
     
     def test_image_data_initialization(self):
         """Test ImageData initialization."""
-        cid = make_msgid(domain='test')
         data = b'fake_image_data'
         content_type = 'image/png'
         filename = 'test.png'
         
-        image_data = ImageData(cid, data, content_type, filename)
+        image_data = ImageData(TEST_CID, data, content_type, filename)
         
-        assert image_data.cid == cid
+        assert image_data.cid == TEST_CID
         assert image_data.data == data
         assert image_data.content_type == content_type
         assert image_data.filename == filename
@@ -33,7 +108,7 @@ class TestImageData:
     def test_image_data_maintype(self):
         """Test ImageData maintype property."""
         image_data = ImageData(
-            make_msgid(),
+            TEST_CID,
             b'data',
             'image/png',
             'test.png'
@@ -43,7 +118,7 @@ class TestImageData:
     def test_image_data_subtype(self):
         """Test ImageData subtype property."""
         image_data = ImageData(
-            make_msgid(),
+            TEST_CID,
             b'data',
             'image/png',
             'test.png'
@@ -53,7 +128,7 @@ class TestImageData:
     def test_image_data_subtype_default(self):
         """Test ImageData subtype with invalid content type."""
         image_data = ImageData(
-            make_msgid(),
+            TEST_CID,
             b'data',
             'invalid',
             'test.png'
@@ -67,182 +142,107 @@ class TestImageProcessorInitialization:
     
     def test_default_initialization(self):
         """Test ImageProcessor with default configuration."""
-        processor = ImageProcessor(
-            base_url="https://confluence.example.com",
-            user="user@example.com",
-            token="api_token"
-        )
-        assert processor is not None
-        assert processor.base_url == "https://confluence.example.com"
-        assert processor.user == "user@example.com"
-        assert processor.token == "api_token"
-        assert processor.timeout == 30
-        assert processor.parser == 'html.parser'
-        processor.close()
+        with make_processor(token="api_token") as processor:
+            assert processor is not None
+            assert processor.base_url == "https://confluence.example.com"
+            assert processor.user == "user@example.com"
+            assert processor.token == "api_token"
+            assert processor.timeout == 30
+            assert processor.parser == 'html.parser'
     
     def test_initialization_with_custom_options(self):
         """Test ImageProcessor with custom configuration."""
-        processor = ImageProcessor(
-            base_url="https://confluence.example.com",
-            user="user@example.com",
-            token="api_token",
-            timeout=60,
-            parser='lxml'
-        )
-        assert processor.timeout == 60
-        assert processor.parser == 'lxml'
-        processor.close()
+        with make_processor(token="api_token", timeout=60, parser='lxml') as processor:
+            assert processor.timeout == 60
+            assert processor.parser == 'lxml'
     
     def test_initialization_strips_base_url_trailing_slash(self):
         """Test that base_url trailing slash is stripped."""
-        processor = ImageProcessor(
-            base_url="https://confluence.example.com/",
-            user="user@example.com",
-            token="api_token"
-        )
-        assert processor.base_url == "https://confluence.example.com"
-        processor.close()
+        with make_processor(base_url="https://confluence.example.com/") as processor:
+            assert processor.base_url == "https://confluence.example.com"
     
-    def test_initialization_without_beautifulsoup(self):
+    def test_initialization_without_beautifulsoup(self, monkeypatch):
         """Test that initialization fails without beautifulsoup4."""
-        with patch('confluence2eml.core.image_processor.BeautifulSoup', None):
-            with pytest.raises(ImageProcessorError) as exc_info:
-                ImageProcessor(
-                    base_url="https://example.com",
-                    user="user@example.com",
-                    token="token"
-                )
-            assert "beautifulsoup4" in str(exc_info.value).lower()
+        monkeypatch.setattr('confluence2eml.core.image_processor.BeautifulSoup', None)
+        with pytest.raises(ImageProcessorError, match="(?i)beautifulsoup4"):
+            ImageProcessor(**PROCESSOR_KWARGS)
     
-    def test_initialization_without_requests(self):
+    def test_initialization_without_requests(self, monkeypatch):
         """Test that initialization fails without requests."""
-        with patch('confluence2eml.core.image_processor.requests', None):
-            with pytest.raises(ImageProcessorError) as exc_info:
-                ImageProcessor(
-                    base_url="https://example.com",
-                    user="user@example.com",
-                    token="token"
-                )
-            assert "requests" in str(exc_info.value).lower()
+        monkeypatch.setattr('confluence2eml.core.image_processor.requests', None)
+        with pytest.raises(ImageProcessorError, match="(?i)requests"):
+            ImageProcessor(**PROCESSOR_KWARGS)
 
 
 @pytest.mark.unit
 class TestImageProcessorProcessImages:
     """Test cases for ImageProcessor.process_images method."""
     
-    def test_process_images_no_images(self):
+    def test_process_images_no_images(self, processor):
         """Test processing HTML with no images."""
-        processor = ImageProcessor(
-            base_url="https://confluence.example.com",
-            user="user@example.com",
-            token="token"
-        )
-        html = "<h1>Title</h1><p>Content</p>"
-        processed, images = processor.process_images(html)
+        processed, images = processor.process_images(NO_IMAGES_HTML)
         
-        assert processed == html or '<h1>Title</h1>' in processed
+        assert processed == NO_IMAGES_HTML or '<h1>Title</h1>' in processed
         assert len(images) == 0
-        processor.close()
     
-    def test_process_images_with_single_image(self, mock_requests_get):
+    def test_process_images_with_single_image(self, processor, mock_requests_get, png_response):
         """Test processing HTML with a single image."""
         # Mock image download
-        mock_response = Mock()
-        mock_response.content = b'fake_png_data'
-        mock_response.headers = {'Content-Type': 'image/png'}
-        mock_response.raise_for_status = Mock()
-        mock_requests_get.return_value = mock_response
+        mock_requests_get.return_value = png_response
         
-        processor = ImageProcessor(
-            base_url="https://confluence.example.com",
-            user="user@example.com",
-            token="token"
-        )
-        html = '<img src="https://confluence.example.com/download/image.png" alt="Image" />'
-        processed, images = processor.process_images(html)
+        processed, images = processor.process_images(ONE_IMAGE_HTML)
         
         assert 'cid:' in processed
         assert len(images) == 1
         assert images[0].content_type == 'image/png'
-        assert images[0].data == b'fake_png_data'
-        processor.close()
+        assert images[0].data == b'fake_image_data'
     
-    def test_process_images_with_multiple_images(self, mock_requests_get):
+    def test_process_images_with_lxml_parser(self, mock_requests_get, png_response):
+        """Test processing images with the optional 'lxml' parser."""
+        pytest.importorskip("lxml")
+        mock_requests_get.return_value = png_response
+        with make_processor(parser='lxml') as processor:
+            processed, images = processor.process_images(ONE_IMAGE_HTML)
+        
+        assert 'src="cid:' in processed
+        assert len(images) == 1
+    
+    def test_process_images_with_multiple_images(self, processor, mock_requests_get, png_response):
         """Test processing HTML with multiple images."""
         # Mock image downloads
-        mock_response = Mock()
-        mock_response.content = b'fake_image_data'
-        mock_response.headers = {'Content-Type': 'image/png'}
-        mock_response.raise_for_status = Mock()
-        mock_requests_get.return_value = mock_response
+        mock_requests_get.return_value = png_response
         
-        processor = ImageProcessor(
-            base_url="https://confluence.example.com",
-            user="user@example.com",
-            token="token"
-        )
-        html = """<img src="https://confluence.example.com/image1.png" />
-                   <img src="https://confluence.example.com/image2.jpg" />"""
-        processed, images = processor.process_images(html)
+        processed, images = processor.process_images(TWO_IMAGES_HTML)
         
         assert processed.count('cid:') == 2
         assert len(images) == 2
-        processor.close()
     
-    def test_process_images_skips_data_uri(self):
+    def test_process_images_skips_data_uri(self, processor):
         """Test that data URIs are skipped."""
-        processor = ImageProcessor(
-            base_url="https://confluence.example.com",
-            user="user@example.com",
-            token="token"
-        )
-        html = '<img src="data:image/png;base64,iVBORw0KGgoAAAANSUhEUgAAAAEAAAABCAYAAAAfFcSJAAAADUlEQVR42mNk+M9QDwADhgGAWjR9awAAAABJRU5ErkJggg==" />'
-        processed, images = processor.process_images(html)
+        processed, images = processor.process_images(DATA_URI_HTML)
         
         assert len(images) == 0
         assert 'data:' in processed
-        processor.close()
     
-    def test_process_images_skips_existing_cid(self):
+    def test_process_images_skips_existing_cid(self, processor):
         """Test that existing CID references are skipped."""
-        processor = ImageProcessor(
-            base_url="https://confluence.example.com",
-            user="user@example.com",
-            token="token"
-        )
         html = '<img src="cid:existing-cid-123" />'
         processed, images = processor.process_images(html)
         
         assert len(images) == 0
         assert 'cid:existing-cid-123' in processed
-        processor.close()
     
-    def test_process_images_handles_missing_src(self):
+    def test_process_images_handles_missing_src(self, processor):
         """Test that images without src attribute are skipped."""
-        processor = ImageProcessor(
-            base_url="https://confluence.example.com",
-            user="user@example.com",
-            token="token"
-        )
         html = '<img alt="No source" />'
         processed, images = processor.process_images(html)
         
         assert len(images) == 0
-        processor.close()
     
-    def test_process_images_rewrites_src_to_cid(self, mock_requests_get):
+    def test_process_images_rewrites_src_to_cid(self, processor, mock_requests_get, png_response):
         """Test that image src attributes are rewritten to CID."""
-        mock_response = Mock()
-        mock_response.content = b'fake_image_data'
-        mock_response.headers = {'Content-Type': 'image/png'}
-        mock_response.raise_for_status = Mock()
-        mock_requests_get.return_value = mock_response
+        mock_requests_get.return_value = png_response
         
-        processor = ImageProcessor(
-            base_url="https://confluence.example.com",
-            user="user@example.com",
-            token="token"
-        )
         html = '<img src="https://confluence.example.com/image.png" alt="Test" />'
         processed, images = processor.process_images(html)
         
@@ -250,58 +250,31 @@ class TestImageProcessorProcessImages:
         assert 'src="cid:' in processed or "src='cid:" in processed
         assert 'https://confluence.example.com/image.png' not in processed
         assert len(images) == 1
-        processor.close()
     
-    def test_process_images_invalid_input_type(self):
+    def test_process_images_invalid_input_type(self, processor):
         """Test that invalid input type raises error."""
-        processor = ImageProcessor(
-            base_url="https://confluence.example.com",
-            user="user@example.com",
-            token="token"
-        )
-        with pytest.raises(ImageProcessorError) as exc_info:
+        with pytest.raises(ImageProcessorError, match="must be a string"):
             processor.process_images(None)  # type: ignore
-        assert "must be a string" in str(exc_info.value)
-        processor.close()
 
 
 @pytest.mark.unit
 class TestImageProcessorDownload:
     """Test cases for image downloading."""
     
-    def test_download_image_absolute_url(self, mock_requests_get):
+    def test_download_image_absolute_url(self, processor, mock_requests_get, png_response):
         """Test downloading image from absolute URL."""
-        mock_response = Mock()
-        mock_response.content = b'fake_image_data'
-        mock_response.headers = {'Content-Type': 'image/png'}
-        mock_response.raise_for_status = Mock()
-        mock_requests_get.return_value = mock_response
+        mock_requests_get.return_value = png_response
         
-        processor = ImageProcessor(
-            base_url="https://confluence.example.com",
-            user="user@example.com",
-            token="token"
-        )
         data, content_type = processor._download_image("https://confluence.example.com/image.png")
         
         assert data == b'fake_image_data'
         assert content_type == 'image/png'
         mock_requests_get.assert_called_once()
-        processor.close()
     
-    def test_download_image_relative_url(self, mock_requests_get):
+    def test_download_image_relative_url(self, processor, mock_requests_get):
         """Test downloading image from relative URL."""
-        mock_response = Mock()
-        mock_response.content = b'fake_image_data'
-        mock_response.headers = {'Content-Type': 'image/jpeg'}
-        mock_response.raise_for_status = Mock()
-        mock_requests_get.return_value = mock_response
+        mock_requests_get.return_value = image_response(content_type='image/jpeg')
         
-        processor = ImageProcessor(
-            base_url="https://confluence.example.com",
-            user="user@example.com",
-            token="token"
-        )
         data, content_type = processor._download_image("/download/image.jpg")
         
         assert data == b'fake_image_data'
@@ -309,201 +282,79 @@ class TestImageProcessorDownload:
         # Verify URL was converted to absolute
         call_args = mock_requests_get.call_args
         assert 'https://confluence.example.com/download/image.jpg' in str(call_args)
-        processor.close()
     
-    def test_download_image_without_content_type(self, mock_requests_get):
+    def test_download_image_without_content_type(self, processor, mock_requests_get):
         """Test downloading image without Content-Type header."""
-        mock_response = Mock()
-        mock_response.content = b'\x89PNG\r\n\x1a\nfake_png_data'
-        mock_response.headers = {}
-        mock_response.raise_for_status = Mock()
-        mock_requests_get.return_value = mock_response
-        
-        processor = ImageProcessor(
-            base_url="https://confluence.example.com",
-            user="user@example.com",
-            token="token"
+        mock_requests_get.return_value = image_response(
+            content=b'\x89PNG\r\n\x1a\nfake_png_data', content_type=None
         )
+        
         data, content_type = processor._download_image("https://confluence.example.com/image.png")
         
         assert data == b'\x89PNG\r\n\x1a\nfake_png_data'
         assert content_type is None or content_type == 'image/png'
-        processor.close()
     
-    def test_download_image_handles_http_error(self, mock_requests_get):
+    def test_download_image_handles_http_error(self, processor, mock_requests_get):
         """Test that HTTP errors are handled."""
         mock_requests_get.side_effect = Exception("Connection error")
         
-        processor = ImageProcessor(
-            base_url="https://confluence.example.com",
-            user="user@example.com",
-            token="token"
-        )
-        
         with pytest.raises(ImageDownloadError):
             processor._download_image("https://confluence.example.com/image.png")
-        processor.close()
     
-    def test_download_image_handles_empty_response(self, mock_requests_get):
+    def test_download_image_handles_empty_response(self, processor, mock_requests_get):
         """Test that empty image data raises error."""
-        mock_response = Mock()
-        mock_response.content = b''
-        mock_response.headers = {'Content-Type': 'image/png'}
-        mock_response.raise_for_status = Mock()
-        mock_requests_get.return_value = mock_response
-        
-        processor = ImageProcessor(
-            base_url="https://confluence.example.com",
-            user="user@example.com",
-            token="token"
-        )
+        mock_requests_get.return_value = image_response(content=b'')
         
-        with pytest.raises(ImageDownloadError) as exc_info:
+        with pytest.raises(ImageDownloadError, match="(?i)empty"):
             processor._download_image("https://confluence.example.com/image.png")
-        assert "empty" in str(exc_info.value).lower()
-        processor.close()
 
 
 @pytest.mark.unit
 class TestImageProcessorCIDGeneration:
     """Test cases for CID generation."""
     
-    def test_generate_cid(self):
-        """Test CID generation."""
-        processor = ImageProcessor(
-            base_url="https://confluence.example.com",
-            user="user@example.com",
-            token="token"
-        )
-        cid = processor._generate_cid()
-        
-        assert cid.startswith('<')
-        assert cid.endswith('>')
-        assert '@confluence-export' in cid
-        processor.close()
-    
-    def test_generate_cid_unique(self):
-        """Test that generated CIDs are unique."""
-        processor = ImageProcessor(
-            base_url="https://confluence.example.com",
-            user="user@example.com",
-            token="token"
-        )
+    def test_generate_cid(self, processor):
+        """Test that generated CIDs are well-formed and unique."""
         cid1 = processor._generate_cid()
         cid2 = processor._generate_cid()
         
+        for cid in (cid1, cid2):
+            assert cid.startswith('<')
+            assert cid.endswith('>')
+            assert '@confluence-export' in cid
         assert cid1 != cid2
-        processor.close()
 
 
 @pytest.mark.unit
 class TestImageProcessorContentTypeDetection:
     """Test cases for content type detection."""
     
-    def test_detect_content_type_from_url(self):
-        """Test content type detection from URL."""
-        processor = ImageProcessor(
-            base_url="https://confluence.example.com",
-            user="user@example.com",
-            token="token"
-        )
-        content_type = processor._detect_content_type(b'data', url='image.png')
-        
-        assert content_type == 'image/png'
-        processor.close()
-    
-    def test_detect_content_type_png_signature(self):
-        """Test PNG detection from magic bytes."""
-        processor = ImageProcessor(
-            base_url="https://confluence.example.com",
-            user="user@example.com",
-            token="token"
-        )
-        png_data = b'\x89PNG\r\n\x1a\n' + b'fake_data'
-        content_type = processor._detect_content_type(png_data)
-        
-        assert content_type == 'image/png'
-        processor.close()
-    
-    def test_detect_content_type_jpeg_signature(self):
-        """Test JPEG detection from magic bytes."""
-        processor = ImageProcessor(
-            base_url="https://confluence.example.com",
-            user="user@example.com",
-            token="token"
-        )
-        jpeg_data = b'\xff\xd8\xff' + b'fake_data'
-        content_type = processor._detect_content_type(jpeg_data)
-        
-        assert content_type == 'image/jpeg'
-        processor.close()
-    
-    def test_detect_content_type_gif_signature(self):
-        """Test GIF detection from magic bytes."""
-        processor = ImageProcessor(
-            base_url="https://confluence.example.com",
-            user="user@example.com",
-            token="token"
-        )
-        gif_data = b'GIF87a' + b'fake_data'
-        content_type = processor._detect_content_type(gif_data)
-        
-        assert content_type == 'image/gif'
-        processor.close()
-    
-    def test_detect_content_type_default_fallback(self):
-        """Test default fallback for unknown image type."""
-        processor = ImageProcessor(
-            base_url="https://confluence.example.com",
-            user="user@example.com",
-            token="token"
-        )
-        unknown_data = b'unknown_image_data'
-        content_type = processor._detect_content_type(unknown_data)
-        
-        assert content_type == 'image/png'  # Default fallback
-        processor.close()
+    @pytest.mark.parametrize("data,url,expected", [
+        (b'data', 'image.png', 'image/png'),
+        (b'\x89PNG\r\n\x1a\n' + b'fake_data', None, 'image/png'),
+        (b'\xff\xd8\xff' + b'fake_data', None, 'image/jpeg'),
+        (b'GIF87a' + b'fake_data', None, 'image/gif'),
+        # Unknown data falls back to PNG
+        (b'unknown_image_data', None, 'image/png'),
+    ], ids=["from_url", "png_signature", "jpeg_signature", "gif_signature",
+            "default_fallback"])
+    def test_detect_content_type(self, processor, data, url, expected):
+        """Test content type detection from URL and magic bytes."""
+        assert processor._detect_content_type(data, url=url) == expected
 
 
 @pytest.mark.unit
 class TestImageProcessorFilenameExtraction:
     """Test cases for filename extraction."""
     
-    def test_extract_filename_from_url(self):
-        """Test filename extraction from URL."""
-        processor = ImageProcessor(
-            base_url="https://confluence.example.com",
-            user="user@example.com",
-            token="token"
-        )
-        filename = processor._extract_filename("https://confluence.example.com/download/image.png")
-        
-        assert filename == "image.png"
-        processor.close()
-    
-    def test_extract_filename_from_path(self):
-        """Test filename extraction from path."""
-        processor = ImageProcessor(
-            base_url="https://confluence.example.com",
-            user="user@example.com",
-            token="token"
-        )
-        filename = processor._extract_filename("/download/attachments/123/photo.jpg")
-        
-        assert filename == "photo.jpg"
-        processor.close()
-    
-    def test_extract_filename_no_filename(self):
-        """Test filename extraction when no filename in URL."""
-        processor = ImageProcessor(
-            base_url="https://confluence.example.com",
-            user="user@example.com",
-            token="token"
-        )
-        filename = processor._extract_filename("https://confluence.example.com/image")
-        
-        assert filename is None
-        processor.close()
+    @pytest.mark.parametrize("url,expected", [
+        ("https://confluence.example.com/download/image.png", "image.png"),
+        ("/download/attachments/123/photo.jpg", "photo.jpg"),
+        ("https://confluence.example.com/image", None),
+    ], ids=["from_url", "from_path", "no_filename"])
+    def test_extract_filename(self, processor, url, expected):
+        """Test filename extraction from URLs and paths."""
+        assert processor._extract_filename(url) == expected
 
 
 @pytest.mark.unit
@@ -512,11 +363,7 @@ class TestImageProcessorClose:
     
     def test_close_session(self):
         """Test that close() closes the requests session."""
-        processor = ImageProcessor(
-            base_url="https://confluence.example.com",
-            user="user@example.com",
-            token="token"
-        )
+        processor = ImageProcessor(**PROCESSOR_KWARGS)
         assert processor.session is not None
         
         processor.close()
@@ -526,9 +373,20 @@ class TestImageProcessorClose:
         assert True
 
 
-@pytest.fixture
-def mock_requests_get():
-    """Fixture to mock requests.get for image downloads."""
+@pytest.fixture(scope="module")
+def _session_get_patcher():
+    """Patch requests.Session.get once for the whole module."""
     with patch('confluence2eml.core.image_processor.requests.Session.get') as mock_get:
         yield mock_get
 
+
+@pytest.fixture
+def mock_requests_get(_session_get_patcher):
+    """Fixture to mock requests.get for image downloads.
+    
+    The patch itself is module-scoped; each test gets the same mock with
+    its calls, return value and side effect reset.
+    """
+    _session_get_patcher.reset_mock(return_value=True, side_effect=True)
+    return _session_get_patcher
+
@@ -1,12 +1,10 @@
 """Tests for main CLI module."""
 
-import email
-import os
+import functools
 import pytest
-import subprocess
 import sys
-from pathlib import Path
-from unittest.mock import MagicMock, patch
+from types import MappingProxyType, SimpleNamespace
+from unittest.mock import create_autospec
 
 from confluence2eml.core.client import (
     ConfluenceClient,
@@ -15,504 +13,240 @@ from confluence2eml.core.client import (
     ConfluencePageNotFoundError,
     URLResolver,
 )
-from confluence2eml.core.html_processor import HtmlProcessorError
-from confluence2eml.core.markdown_processor import MarkdownProcessorError
-from confluence2eml.core.mime_generator import MimeGeneratorError
+from confluence2eml.core.css_inliner import CssInliner
+from confluence2eml.core.html_processor import HtmlProcessor, HtmlProcessorError
+from confluence2eml.core.image_processor import ImageProcessor
+from confluence2eml.core.markdown_processor import MarkdownProcessor, MarkdownProcessorError
+from confluence2eml.core.mime_generator import MimeGenerator, MimeGeneratorError
+from confluence2eml.main import get_credentials, main, parse_arguments
+
+# The package exports the main() function under the submodule's name, so
+# dotted-path patching cannot reach the module; patch it through this object
+CLI_MODULE = sys.modules[main.__module__]
 
 
 @pytest.mark.unit
 class TestCLIArgumentParsing:
     """Test cases for CLI argument parsing."""
     
-    def test_parse_arguments_required_url(self):
-        """Test that --url is required."""
-        from confluence2eml.main import parse_arguments
-        
-        with patch.object(sys, 'argv', ['confluence2eml', '--output', 'test.eml']):
-            with pytest.raises(SystemExit):
-                parse_arguments()
-    
-    def test_parse_arguments_required_output(self):
-        """Test that --output is required."""
-        from confluence2eml.main import parse_arguments
-        
-        with patch.object(sys, 'argv', ['confluence2eml', '--url', 'https://example.com/wiki/pages/123']):
-            with pytest.raises(SystemExit):
-                parse_arguments()
-    
-    def test_parse_arguments_with_all_required(self):
-        """Test parsing with all required arguments."""
-        from confluence2eml.main import parse_arguments
-        
-        with patch.object(sys, 'argv', [
-            'confluence2eml',
-            '--url', 'https://example.com/wiki/pages/123',
-            '--output', 'test.eml'
-        ]):
-            args = parse_arguments()
-            
-            assert args.url == 'https://example.com/wiki/pages/123'
-            assert args.output == 'test.eml'
-    
-    def test_parse_arguments_with_optional_user_token(self):
-        """Test parsing with optional user and token."""
-        from confluence2eml.main import parse_arguments
-        
-        with patch.object(sys, 'argv', [
-            'confluence2eml',
-            '--url', 'https://example.com/wiki/pages/123',
-            '--output', 'test.eml',
-            '--user', 'user@example.com',
-            '--token', 'token123'
-        ]):
-            args = parse_arguments()
-            
-            assert args.user == 'user@example.com'
-            assert args.token == 'token123'
-    
-    def test_parse_arguments_verbose_flag(self):
-        """Test parsing with verbose flag."""
-        from confluence2eml.main import parse_arguments
-        
-        with patch.object(sys, 'argv', [
-            'confluence2eml',
+    @pytest.mark.parametrize("argv", [
+        ['--output', 'test.eml'],
+        ['--url', 'https://example.com/wiki/pages/123'],
+    ], ids=["required_url", "required_output"])
+    def test_parse_arguments_missing_required(self, argv):
+        """Test that --url and --output are required."""
+        with pytest.raises(SystemExit):
+            parse_arguments(argv)
+    
+    @pytest.mark.parametrize("extra_argv,expected", [
+        ([], {'url': 'https://example.com/wiki/pages/123', 'output': 'test.eml'}),
+        (['--user', 'user@example.com', '--token', 'token123'],
+         {'user': 'user@example.com', 'token': 'token123'}),
+        (['--verbose'], {'verbose': True}),
+        (['-v'], {'verbose': True}),
+    ], ids=["with_all_required", "with_optional_user_token", "verbose_flag",
+            "short_verbose_flag"])
+    def test_parse_arguments(self, extra_argv, expected):
+        """Test parsing the required arguments plus optional flags."""
+        args = parse_arguments([
             '--url', 'https://example.com/wiki/pages/123',
             '--output', 'test.eml',
-            '--verbose'
-        ]):
-            args = parse_arguments()
-            
-            assert args.verbose is True
-    
-    def test_parse_arguments_short_verbose_flag(self):
-        """Test parsing with short verbose flag."""
-        from confluence2eml.main import parse_arguments
+            *extra_argv
+        ])
         
-        with patch.object(sys, 'argv', [
-            'confluence2eml',
-            '--url', 'https://example.com/wiki/pages/123',
-            '--output', 'test.eml',
-            '-v'
-        ]):
-            args = parse_arguments()
-            
-            assert args.verbose is True
+        for name, value in expected.items():
+            assert getattr(args, name) == value
+
+
+@pytest.fixture
+def make_args():
+    """Return a factory for the parsed-arguments object get_credentials() reads.
+    
+    user and token default to None, as when the options are not given.
+    """
+    def _make(**overrides):
+        return SimpleNamespace(**{'user': None, 'token': None, **overrides})
+    return _make
 
 
 @pytest.mark.unit
+@pytest.mark.usefixtures("reset_environment")
 class TestCLICredentials:
     """Test cases for credential handling."""
     
-    def test_get_credentials_from_args(self):
+    def test_get_credentials_from_args(self, make_args):
         """Test getting credentials from CLI arguments."""
-        from confluence2eml.main import get_credentials
-        
-        class Args:
-            user = 'user@example.com'
-            token = 'token123'
-        
-        args = Args()
+        args = make_args(user='user@example.com', token='token123')
         user, token = get_credentials(args)
         
         assert user == 'user@example.com'
         assert token == 'token123'
     
-    def test_get_credentials_from_env(self, monkeypatch):
+    def test_get_credentials_from_env(self, make_args, monkeypatch):
         """Test getting credentials from environment variables."""
-        from confluence2eml.main import get_credentials
-        
         monkeypatch.setenv('CONFLUENCE_USER', 'env_user@example.com')
         monkeypatch.setenv('CONFLUENCE_TOKEN', 'env_token123')
         
-        class Args:
-            user = None
-            token = None
-        
-        args = Args()
+        args = make_args()
         user, token = get_credentials(args)
         
         assert user == 'env_user@example.com'
         assert token == 'env_token123'
     
-    def test_get_credentials_args_override_env(self, monkeypatch):
+    def test_get_credentials_args_override_env(self, make_args, monkeypatch):
         """Test that CLI arguments override environment variables."""
-        from confluence2eml.main import get_credentials
-        
         monkeypatch.setenv('CONFLUENCE_USER', 'env_user@example.com')
         monkeypatch.setenv('CONFLUENCE_TOKEN', 'env_token123')
         
-        class Args:
-            user = 'arg_user@example.com'
-            token = 'arg_token123'
-        
-        args = Args()
+        args = make_args(user='arg_user@example.com', token='arg_token123')
         user, token = get_credentials(args)
         
         assert user == 'arg_user@example.com'
         assert token == 'arg_token123'
     
-    def test_get_credentials_missing_user(self):
+    def test_get_credentials_missing_user(self, make_args):
         """Test that missing user raises ValueError."""
-        from confluence2eml.main import get_credentials
-        
-        class Args:
-            user = None
-            token = 'token123'
-        
-        args = Args()
+        args = make_args(token='token123')
         with pytest.raises(ValueError) as exc_info:
             get_credentials(args)
         
         assert 'user' in str(exc_info.value).lower()
     
-    def test_get_credentials_missing_token(self):
+    def test_get_credentials_missing_token(self, make_args):
         """Test that missing token raises ValueError."""
-        from confluence2eml.main import get_credentials
-        
-        class Args:
-            user = 'user@example.com'
-            token = None
-        
-        args = Args()
+        args = make_args(user='user@example.com')
         with pytest.raises(ValueError) as exc_info:
             get_credentials(args)
         
         assert 'token' in str(exc_info.value).lower()
 
 
+# Classes main() drives, keyed by the attribute name used on patched_pipeline
+PIPELINE_CLASSES = MappingProxyType({
+    'url_resolver': URLResolver,
+    'client': ConfluenceClient,
+    'md_proc': MarkdownProcessor,
+    'html_proc': HtmlProcessor,
+    'css_inliner': CssInliner,
+    'image_proc': ImageProcessor,
+    'mime_gen': MimeGenerator,
+})
+
+
+# Page content returned by the mocked ConfluenceClient, and the HTML every
+# mocked processing stage returns; main() only reads them
+STUB_PAGE = MappingProxyType({
+    'markdown': '# Test Page\n\nContent here.',
+    'title': 'Test Page',
+    'attachments': ()
+})
+STUB_HTML = '<h1>Test Page</h1><p>Content here.</p>'
+
+# Arguments for a main() run, passed directly rather than through sys.argv;
+# each test appends its own --output
+MAIN_ARGV = ['--url', 'https://example.com/wiki/pages/123456']
+
+
+@pytest.fixture(scope="module")
+def pipeline_templates():
+    """Return one autospec'd mock per pipeline class, built once per module.
+    
+    create_autospec() walks the whole class, so the mocks are built once and
+    reset by patched_pipeline before each test rather than rebuilt.
+    """
+    return {name: create_autospec(cls) for name, cls in PIPELINE_CLASSES.items()}
+
+
+@pytest.fixture
+def patched_pipeline(monkeypatch, pipeline_templates):
+    """Patch every pipeline class in confluence2eml.main with a happy-path mock.
+    
+    Returns a namespace of the class mocks; tests override the one stage
+    they exercise, e.g. ``patched_pipeline.md_proc.side_effect = ...``.
+    """
+    for name, mock_cls in pipeline_templates.items():
+        mock_cls.reset_mock(side_effect=True)
+        mock_cls.return_value.reset_mock(side_effect=True)
+        monkeypatch.setattr(CLI_MODULE, PIPELINE_CLASSES[name].__name__, mock_cls)
+    pipeline = SimpleNamespace(**pipeline_templates)
+    
+    pipeline.url_resolver.extract_page_id.return_value = '123456'
+    pipeline.url_resolver.extract_base_url.return_value = 'https://example.com'
+    pipeline.client.return_value.get_page_content.return_value = STUB_PAGE
+    pipeline.md_proc.return_value.convert.return_value = STUB_HTML
+    pipeline.html_proc.return_value.sanitize.return_value = STUB_HTML
+    pipeline.css_inliner.return_value.inline.return_value = STUB_HTML
+    pipeline.image_proc.return_value.process_images.return_value = (STUB_HTML, [])
+    pipeline.mime_gen.return_value._html_to_plain_text.return_value = 'Test Page\n\nContent here.'
+    return pipeline
+
+
 @pytest.mark.unit
 class TestCLIMainFunction:
     """Test cases for main() function."""
     
-    @patch('confluence2eml.main.URLResolver')
-    @patch('confluence2eml.main.ConfluenceClient')
-    @patch('confluence2eml.main.MarkdownProcessor')
-    @patch('confluence2eml.main.HtmlProcessor')
-    @patch('confluence2eml.main.CssInliner')
-    @patch('confluence2eml.main.ImageProcessor')
-    @patch('confluence2eml.main.MimeGenerator')
-    def test_main_successful_export(
-        self,
-        mock_mime_gen,
-        mock_image_proc,
-        mock_css_inliner,
-        mock_html_proc,
-        mock_md_proc,
-        mock_client,
-        mock_url_resolver,
-        temp_output_dir,
-        monkeypatch
-    ):
-        """Test successful end-to-end export."""
-        from confluence2eml.main import main
-        
-        # Setup mocks
-        mock_url_resolver.extract_page_id.return_value = '123456'
-        mock_url_resolver.extract_base_url.return_value = 'https://example.com'
-        
-        mock_client_instance = MagicMock()
-        mock_client_instance.get_page_content.return_value = {
-            'markdown': '# Test Page\n\nContent here.',
-            'title': 'Test Page',
-            'attachments': []
-        }
-        mock_client.return_value = mock_client_instance
-        
-        mock_md_processor = MagicMock()
-        mock_md_processor.convert.return_value = '<h1>Test Page</h1><p>Content here.</p>'
-        mock_md_proc.return_value = mock_md_processor
-        
-        mock_html_processor = MagicMock()
-        mock_html_processor.sanitize.return_value = '<h1>Test Page</h1><p>Content here.</p>'
-        mock_html_proc.return_value = mock_html_processor
-        
-        mock_css_inliner_instance = MagicMock()
-        mock_css_inliner_instance.inline.return_value = '<h1>Test Page</h1><p>Content here.</p>'
-        mock_css_inliner.return_value = mock_css_inliner_instance
-        
-        mock_image_processor_instance = MagicMock()
-        mock_image_processor_instance.process_images.return_value = (
-            '<h1>Test Page</h1><p>Content here.</p>',
-            []
-        )
-        mock_image_proc.return_value = mock_image_processor_instance
-        
-        mock_mime_gen_instance = MagicMock()
-        mock_mime_gen_instance._html_to_plain_text.return_value = 'Test Page\n\nContent here.'
-        mock_mime_gen_instance.create_and_save.return_value = Path(temp_output_dir / 'test.eml')
-        mock_mime_gen.return_value = mock_mime_gen_instance
-        
-        # Set environment variables
+    @pytest.fixture(autouse=True)
+    def credentials_env(self, monkeypatch):
+        """Provide Confluence credentials through the environment."""
         monkeypatch.setenv('CONFLUENCE_USER', 'test@example.com')
         monkeypatch.setenv('CONFLUENCE_TOKEN', 'test_token')
-        
-        # Mock sys.argv
-        test_args = [
-            'confluence2eml',
-            '--url', 'https://example.com/wiki/pages/123456',
-            '--output', str(temp_output_dir / 'test.eml')
-        ]
-        
-        with patch.object(sys, 'argv', test_args):
-            # Should not raise an exception
-            try:
-                main()
-            except SystemExit as e:
-                # SystemExit(0) is success
-                assert e.code == 0
     
-    @patch('confluence2eml.main.URLResolver')
-    def test_main_invalid_url(self, mock_url_resolver, monkeypatch):
-        """Test main() with invalid URL."""
-        from confluence2eml.main import main
-        
-        mock_url_resolver.extract_page_id.side_effect = ConfluenceClientError("Invalid URL")
-        
-        monkeypatch.setenv('CONFLUENCE_USER', 'test@example.com')
-        monkeypatch.setenv('CONFLUENCE_TOKEN', 'test_token')
-        
-        test_args = [
-            'confluence2eml',
-            '--url', 'invalid-url',
-            '--output', 'test.eml'
-        ]
-        
-        with patch.object(sys, 'argv', test_args):
-            with pytest.raises(SystemExit) as exc_info:
-                main()
-            assert exc_info.value.code == 1
-    
-    @patch('confluence2eml.main.URLResolver')
-    @patch('confluence2eml.main.ConfluenceClient')
-    def test_main_authentication_error(
-        self,
-        mock_client,
-        mock_url_resolver,
-        monkeypatch
-    ):
-        """Test main() with authentication error."""
-        from confluence2eml.main import main
-        
-        mock_url_resolver.extract_page_id.return_value = '123456'
-        mock_url_resolver.extract_base_url.return_value = 'https://example.com'
-        
-        mock_client.side_effect = ConfluenceAuthenticationError("Authentication failed")
-        
-        monkeypatch.setenv('CONFLUENCE_USER', 'test@example.com')
-        monkeypatch.setenv('CONFLUENCE_TOKEN', 'test_token')
-        
-        test_args = [
-            'confluence2eml',
-            '--url', 'https://example.com/wiki/pages/123456',
-            '--output', 'test.eml'
-        ]
-        
-        with patch.object(sys, 'argv', test_args):
-            with pytest.raises(SystemExit) as exc_info:
-                main()
-            assert exc_info.value.code == 1
-    
-    @patch('confluence2eml.main.URLResolver')
-    @patch('confluence2eml.main.ConfluenceClient')
-    def test_main_page_not_found(
-        self,
-        mock_client,
-        mock_url_resolver,
-        monkeypatch
-    ):
-        """Test main() with page not found error."""
-        from confluence2eml.main import main
-        
-        mock_url_resolver.extract_page_id.return_value = '123456'
-        mock_url_resolver.extract_base_url.return_value = 'https://example.com'
-        
-        mock_client_instance = MagicMock()
-        mock_client_instance.get_page_content.side_effect = ConfluencePageNotFoundError("Page not found")
-        mock_client.return_value = mock_client_instance
-        
-        monkeypatch.setenv('CONFLUENCE_USER', 'test@example.com')
-        monkeypatch.setenv('CONFLUENCE_TOKEN', 'test_token')
-        
-        test_args = [
-            'confluence2eml',
-            '--url', 'https://example.com/wiki/pages/123456',
-            '--output', 'test.eml'
-        ]
-        
-        with patch.object(sys, 'argv', test_args):
-            with pytest.raises(SystemExit) as exc_info:
-                main()
-            assert exc_info.value.code == 1
-    
-    @patch('confluence2eml.main.URLResolver')
-    @patch('confluence2eml.main.ConfluenceClient')
-    @patch('confluence2eml.main.MarkdownProcessor')
-    def test_main_markdown_conversion_error(
-        self,
-        mock_md_proc,
-        mock_client,
-        mock_url_resolver,
-        monkeypatch
-    ):
-        """Test main() with Markdown conversion error."""
-        from confluence2eml.main import main
-        
-        mock_url_resolver.extract_page_id.return_value = '123456'
-        mock_url_resolver.extract_base_url.return_value = 'https://example.com'
-        
-        mock_client_instance = MagicMock()
-        mock_client_instance.get_page_content.return_value = {
-            'markdown': '# Test Page',
-            'title': 'Test Page'
-        }
-        mock_client.return_value = mock_client_instance
-        
-        mock_md_proc.side_effect = MarkdownProcessorError("Markdown conversion failed")
-        
-        monkeypatch.setenv('CONFLUENCE_USER', 'test@example.com')
-        monkeypatch.setenv('CONFLUENCE_TOKEN', 'test_token')
-        
-        test_args = [
-            'confluence2eml',
-            '--url', 'https://example.com/wiki/pages/123456',
-            '--output', 'test.eml'
-        ]
-        
-        with patch.object(sys, 'argv', test_args):
-            with pytest.raises(SystemExit) as exc_info:
-                main()
-            assert exc_info.value.code == 1
-    
-    @patch('confluence2eml.main.URLResolver')
-    @patch('confluence2eml.main.ConfluenceClient')
-    @patch('confluence2eml.main.MarkdownProcessor')
-    @patch('confluence2eml.main.HtmlProcessor')
-    @patch('confluence2eml.main.CssInliner')
-    @patch('confluence2eml.main.ImageProcessor')
-    def test_main_html_sanitization_error(
-        self,
-        mock_image_proc,
-        mock_css_inliner,
-        mock_html_proc,
-        mock_md_proc,
-        mock_client,
-        mock_url_resolver,
-        monkeypatch
-    ):
-        """Test main() with HTML sanitization error."""
-        from confluence2eml.main import main
-        
-        mock_url_resolver.extract_page_id.return_value = '123456'
-        mock_url_resolver.extract_base_url.return_value = 'https://example.com'
-        
-        mock_client_instance = MagicMock()
-        mock_client_instance.get_page_content.return_value = {
-            'markdown': '# Test Page',
-            'title': 'Test Page'
-        }
-        mock_client.return_value = mock_client_instance
-        
-        mock_md_processor = MagicMock()
-        mock_md_processor.convert.return_value = '<h1>Test</h1>'
-        mock_md_proc.return_value = mock_md_processor
-        
-        mock_html_proc.side_effect = HtmlProcessorError("HTML sanitization failed")
-        
-        monkeypatch.setenv('CONFLUENCE_USER', 'test@example.com')
-        monkeypatch.setenv('CONFLUENCE_TOKEN', 'test_token')
-        
-        test_args = [
-            'confluence2eml',
-            '--url', 'https://example.com/wiki/pages/123456',
-            '--output', 'test.eml'
-        ]
-        
-        with patch.object(sys, 'argv', test_args):
-            with pytest.raises(SystemExit) as exc_info:
-                main()
-            assert exc_info.value.code == 1
+    @pytest.fixture(autouse=True)
+    def isolated_cwd(self, monkeypatch, tmp_path):
+        """Run main() from tmp_path so no output lands in the working directory."""
+        monkeypatch.chdir(tmp_path)
     
-    @patch('confluence2eml.main.URLResolver')
-    @patch('confluence2eml.main.ConfluenceClient')
-    @patch('confluence2eml.main.MarkdownProcessor')
-    @patch('confluence2eml.main.HtmlProcessor')
-    @patch('confluence2eml.main.CssInliner')
-    @patch('confluence2eml.main.ImageProcessor')
-    @patch('confluence2eml.main.MimeGenerator')
-    def test_main_eml_generation_error(
-        self,
-        mock_mime_gen,
-        mock_image_proc,
-        mock_css_inliner,
-        mock_html_proc,
-        mock_md_proc,
-        mock_client,
-        mock_url_resolver,
-        monkeypatch
-    ):
-        """Test main() with EML generation error."""
-        from confluence2eml.main import main
-        
-        mock_url_resolver.extract_page_id.return_value = '123456'
-        mock_url_resolver.extract_base_url.return_value = 'https://example.com'
-        
-        mock_client_instance = MagicMock()
-        mock_client_instance.get_page_content.return_value = {
-            'markdown': '# Test Page',
-            'title': 'Test Page'
-        }
-        mock_client.return_value = mock_client_instance
-        
-        mock_md_processor = MagicMock()
-        mock_md_processor.convert.return_value = '<h1>Test</h1>'
-        mock_md_proc.return_value = mock_md_processor
-        
-        mock_html_processor = MagicMock()
-        mock_html_processor.sanitize.return_value = '<h1>Test</h1>'
-        mock_html_proc.return_value = mock_html_processor
-        
-        mock_mime_gen.side_effect = MimeGeneratorError("EML generation failed")
-        
-        monkeypatch.setenv('CONFLUENCE_USER', 'test@example.com')
-        monkeypatch.setenv('CONFLUENCE_TOKEN', 'test_token')
-        
-        test_args = [
-            'confluence2eml',
-            '--url', 'https://example.com/wiki/pages/123456',
-            '--output', 'test.eml'
-        ]
-        
-        with patch.object(sys, 'argv', test_args):
-            with pytest.raises(SystemExit) as exc_info:
-                main()
-            assert exc_info.value.code == 1
+    def test_main_successful_export(self, patched_pipeline, temp_output_dir):
+        """Test successful end-to-end export."""
+        # main() reports the size of the EML file, so it has to exist
+        eml_path = temp_output_dir / 'test.eml'
+        eml_path.write_bytes(b'')
+        patched_pipeline.mime_gen.return_value.create_and_save.return_value = eml_path
+        
+        # Should not raise an exception
+        main([*MAIN_ARGV, '--output', str(eml_path)])
+        
+        patched_pipeline.mime_gen.return_value.create_and_save.assert_called_once()
+    
+    @pytest.mark.parametrize("stage,exc", [
+        ('url_resolver.extract_page_id', ConfluenceClientError("Invalid URL")),
+        ('client', ConfluenceAuthenticationError("Authentication failed")),
+        ('client.return_value.get_page_content', ConfluencePageNotFoundError("Page not found")),
+        ('md_proc', MarkdownProcessorError("Markdown conversion failed")),
+        ('html_proc', HtmlProcessorError("HTML sanitization failed")),
+        ('mime_gen', MimeGeneratorError("EML generation failed")),
+    ], ids=["invalid_url", "authentication_error", "page_not_found",
+            "markdown_conversion_error", "html_sanitization_error", "eml_generation_error"])
+    def test_main_error(self, patched_pipeline, tmp_path, stage, exc):
+        """Test that main() exits with status 1 when a pipeline stage fails."""
+        # stage is a dotted attribute path on patched_pipeline
+        functools.reduce(getattr, stage.split('.'), patched_pipeline).side_effect = exc
+        
+        with pytest.raises(SystemExit) as exc_info:
+            main([*MAIN_ARGV, '--output', str(tmp_path / 'test.eml')])
+        assert exc_info.value.code == 1
 
 
 @pytest.mark.integration
 class TestCLIIntegration:
     """Integration tests for CLI."""
     
-    def test_cli_help_message(self):
+    def test_cli_help_message(self, capsys):
         """Test that CLI help message is displayed."""
-        result = subprocess.run(
-            [sys.executable, '-m', 'confluence2eml.main', '--help'],
-            capture_output=True,
-            text=True
-        )
+        with pytest.raises(SystemExit) as exc_info:
+            parse_arguments(['--help'])
         
-        assert result.returncode == 0
-        assert 'Confluence' in result.stdout
-        assert '--url' in result.stdout
-        assert '--output' in result.stdout
+        assert exc_info.value.code == 0
+        out = capsys.readouterr().out
+        assert 'Confluence' in out
+        assert '--url' in out
+        assert '--output' in out
     
-    def test_cli_missing_required_args(self):
+    def test_cli_missing_required_args(self, capsys):
         """Test that CLI exits with error when required args are missing."""
-        result = subprocess.run(
-            [sys.executable, '-m', 'confluence2eml.main'],
-            capture_output=True,
-            text=True
-        )
+        with pytest.raises(SystemExit) as exc_info:
+            parse_arguments([])
         
-        assert result.returncode != 0
-        assert 'error' in result.stderr.lower() or 'required' in result.stderr.lower()
-
+        assert exc_info.value.code != 0
+        err = capsys.readouterr().err.lower()
+        assert 'error' in err or 'required' in err
@@ -7,6 +7,58 @@ from confluence2eml.core.markdown_processor import (
     MarkdownProcessor,
     MarkdownProcessorError,
 )
+from tests.helpers import assert_contains_all
+
+
+def assert_in_order(html, needles):
+    """Assert that needles occur in html in the given order.
+    
+    Each needle is searched for from the end of the previous match, so the
+    whole check reads html once.
+    """
+    pos = 0
+    for needle in needles:
+        index = html.find(needle, pos)
+        assert index >= 0, f"{needle!r} not found after position {pos}"
+        pos = index + len(needle)
+
+
+@pytest.fixture(scope="module", autouse=True)
+def default_markdown_backend():
+    """Clear MARKDOWN_BACKEND so every processor here uses the markdown library.
+    
+    Module-scoped so it also runs before the shared processors below are
+    built; the backend tests set the variable themselves.
+    """
+    with pytest.MonkeyPatch.context() as mp:
+        mp.delenv('MARKDOWN_BACKEND', raising=False)
+        yield
+
+
+@pytest.fixture(scope="module")
+def md_processor():
+    """Return a MarkdownProcessor with the default configuration.
+    
+    convert() keeps no state between calls, so one instance is shared by
+    every test in this module that does not need custom extensions.
+    """
+    return MarkdownProcessor()
+
+
+@pytest.fixture(scope="module")
+def minimal_processor():
+    """Return a MarkdownProcessor with no extensions.
+    
+    For tests of core Markdown syntax, which none of the default
+    extensions change.
+    """
+    return MarkdownProcessor(extensions=[])
+
+
+@pytest.fixture(scope="module")
+def sample_markdown_html(md_processor, sample_markdown_content):
+    """Return sample_markdown_content rendered once with the default processor."""
+    return md_processor.convert(sample_markdown_content)
 
 
 @pytest.mark.unit
@@ -27,6 +79,16 @@ class TestMarkdownProcessorInitialization:
         processor = MarkdownProcessor(extensions=custom_extensions)
         assert processor.extensions == custom_extensions
     
+    def test_empty_extensions(self, minimal_processor):
+        """Test that an empty extensions list disables the default extensions."""
+        assert minimal_processor.extensions == []
+        
+        html = minimal_processor.convert(
+            "| A | B |\n|---|---|\n| 1 | 2 |\n\n```python\nx = 1\n```"
+        )
+        assert "<table>" not in html
+        assert "<pre>" not in html
+    
     def test_custom_extension_configs(self):
         """Test MarkdownProcessor with custom extension configurations."""
         custom_configs = {
@@ -55,121 +117,109 @@ class TestMarkdownProcessorInitialization:
 class TestMarkdownProcessorConvert:
     """Test cases for MarkdownProcessor.convert method."""
     
-    def test_convert_simple_text(self):
+    def test_convert_simple_text(self, minimal_processor):
         """Test converting simple Markdown text."""
-        processor = MarkdownProcessor()
         markdown = "This is simple text."
-        html = processor.convert(markdown)
+        html = minimal_processor.convert(markdown)
         assert "<p>This is simple text.</p>" in html
     
-    def test_convert_heading(self):
+    def test_convert_heading(self, minimal_processor):
         """Test converting Markdown headings."""
-        processor = MarkdownProcessor()
         markdown = "# Heading 1\n## Heading 2\n### Heading 3"
-        html = processor.convert(markdown)
-        assert "<h1>Heading 1</h1>" in html
-        assert "<h2>Heading 2</h2>" in html
-        assert "<h3>Heading 3</h3>" in html
+        html = minimal_processor.convert(markdown)
+        assert_contains_all(html, [
+            "<h1>Heading 1</h1>",
+            "<h2>Heading 2</h2>",
+            "<h3>Heading 3</h3>",
+        ])
     
-    def test_convert_bold_and_italic(self):
+    def test_convert_bold_and_italic(self, minimal_processor):
         """Test converting bold and italic text."""
-        processor = MarkdownProcessor()
         markdown = "This is **bold** and *italic* text."
-        html = processor.convert(markdown)
+        html = minimal_processor.convert(markdown)
         assert "<strong>bold</strong>" in html
         assert "<em>italic</em>" in html
     
-    def test_convert_lists(self):
+    def test_convert_lists(self, md_processor):
         """Test converting unordered and ordered lists."""
-        processor = MarkdownProcessor()
-        
         # Unordered list
         markdown = "- Item 1\n- Item 2\n- Item 3"
-        html = processor.convert(markdown)
-        assert "<ul>" in html
-        assert "<li>Item 1</li>" in html
-        assert "<li>Item 2</li>" in html
-        assert "<li>Item 3</li>" in html
+        html = md_processor.convert(markdown)
+        assert_contains_all(html, ["<ul>", "<li>Item 1</li>", "<li>Item 2</li>", "<li>Item 3</li>"])
         
         # Ordered list
         markdown = "1. First\n2. Second\n3. Third"
-        html = processor.convert(markdown)
+        html = md_processor.convert(markdown)
         assert "<ol>" in html
         assert "<li>First</li>" in html
     
-    def test_convert_links(self):
+    def test_convert_links(self, minimal_processor):
         """Test converting Markdown links."""
-        processor = MarkdownProcessor()
         markdown = "[Link Text](https://example.com)"
-        html = processor.convert(markdown)
+        html = minimal_processor.convert(markdown)
         assert "<a href=\"https://example.com\">Link Text</a>" in html
     
-    def test_convert_images(self):
+    def test_convert_images(self, md_processor):
         """Test converting Markdown images."""
-        processor = MarkdownProcessor()
         markdown = "![Alt Text](https://example.com/image.png)"
-        html = processor.convert(markdown)
-        assert "<img" in html
-        assert "alt=\"Alt Text\"" in html
-        assert "src=\"https://example.com/image.png\"" in html
+        html = md_processor.convert(markdown)
+        assert_contains_all(html, [
+            "<img",
+            "alt=\"Alt Text\"",
+            "src=\"https://example.com/image.png\"",
+        ])
     
-    def test_convert_code_inline(self):
+    def test_convert_code_inline(self, md_processor):
         """Test converting inline code."""
-        processor = MarkdownProcessor()
         markdown = "This is `inline code` in text."
-        html = processor.convert(markdown)
+        html = md_processor.convert(markdown)
         assert "<code>inline code</code>" in html
     
-    def test_convert_code_block_fenced(self):
+    def test_convert_code_block_fenced(self, md_processor):
         """Test converting fenced code blocks."""
-        processor = MarkdownProcessor()
         markdown = """```python
 def hello():
     print("Hello, World!")
 ```"""
-        html = processor.convert(markdown)
-        assert "<pre>" in html
-        assert "<code" in html
-        assert "def hello()" in html
+        html = md_processor.convert(markdown)
+        assert_contains_all(html, ["<pre>", "<code", "def hello()"])
     
-    def test_convert_tables(self):
+    def test_convert_tables(self, md_processor):
         """Test converting Markdown tables."""
-        processor = MarkdownProcessor()
         markdown = """| Column 1 | Column 2 |
 |----------|----------|
 | Value 1  | Value 2  |
 | Value 3  | Value 4  |"""
-        html = processor.convert(markdown)
-        assert "<table>" in html
-        assert "<thead>" in html
-        assert "<tbody>" in html
-        assert "<th>Column 1</th>" in html
-        assert "<td>Value 1</td>" in html
+        html = md_processor.convert(markdown)
+        assert_contains_all(html, [
+            "<table>",
+            "<thead>",
+            "<tbody>",
+            "<th>Column 1</th>",
+            "<td>Value 1</td>",
+        ])
     
-    def test_convert_blockquote(self):
+    def test_convert_blockquote(self, md_processor):
         """Test converting blockquotes."""
-        processor = MarkdownProcessor()
         markdown = "> This is a quote\n> with multiple lines"
-        html = processor.convert(markdown)
+        html = md_processor.convert(markdown)
         assert "<blockquote>" in html
     
-    def test_convert_horizontal_rule(self):
+    def test_convert_horizontal_rule(self, md_processor):
         """Test converting horizontal rules."""
-        processor = MarkdownProcessor()
         markdown = "Text above\n\n---\n\nText below"
-        html = processor.convert(markdown)
+        html = md_processor.convert(markdown)
         assert "<hr" in html
     
-    def test_convert_empty_string(self):
+    def test_convert_empty_string(self, md_processor):
         """Test converting empty Markdown string."""
-        processor = MarkdownProcessor()
-        html = processor.convert("")
+        html = md_processor.convert("")
         # Empty string should produce empty or minimal HTML
         assert isinstance(html, str)
     
-    def test_convert_multiline_content(self):
+    @pytest.mark.slow
+    def test_convert_multiline_content(self, md_processor):
         """Test converting complex multiline Markdown content."""
-        processor = MarkdownProcessor()
         markdown = """# Main Title
 
 This is a paragraph with **bold** and *italic* text.
@@ -192,26 +242,28 @@ def example():
 |----------|----------|
 | Data 1   | Data 2   |
 """
-        html = processor.convert(markdown)
-        assert "<h1>Main Title</h1>" in html
-        assert "<h2>Section 1</h2>" in html
-        assert "<h3>Subsection</h3>" in html
-        assert "<ul>" in html
-        assert "<table>" in html
-        assert "<pre>" in html
+        html = md_processor.convert(markdown)
+        # Block elements are rendered in source order
+        assert_in_order(html, [
+            "<h1>Main Title</h1>",
+            "<h2>Section 1</h2>",
+            "<ul>",
+            "<h3>Subsection</h3>",
+            "<pre>",
+            "<table>",
+        ])
     
-    def test_convert_invalid_input_type(self):
+    def test_convert_invalid_input_type(self, md_processor):
         """Test that convert raises error for invalid input type."""
-        processor = MarkdownProcessor()
         with pytest.raises(MarkdownProcessorError) as exc_info:
-            processor.convert(123)  # type: ignore
+            md_processor.convert(123)  # type: ignore
         assert "must be a string" in str(exc_info.value).lower()
     
-    def test_convert_unicode_content(self):
+    @pytest.mark.slow
+    def test_convert_unicode_content(self, md_processor):
         """Test converting Markdown with Unicode characters."""
-        processor = MarkdownProcessor()
         markdown = "# Page with émojis 🎉\n\nContent with ñoño and 中文"
-        html = processor.convert(markdown)
+        html = md_processor.convert(markdown)
         assert "<h1>" in html
         # Unicode should be preserved in HTML
         assert "émojis" in html or "mojis" in html
@@ -221,83 +273,66 @@ def example():
 class TestMarkdownProcessorConvertFile:
     """Test cases for MarkdownProcessor.convert_file method."""
     
-    def test_convert_file(self, temp_markdown_file):
+    def test_convert_file(self, md_processor, temp_markdown_file):
         """Test converting a Markdown file to HTML."""
-        processor = MarkdownProcessor()
-        html = processor.convert_file(str(temp_markdown_file))
+        html = md_processor.convert_file(str(temp_markdown_file))
         
         assert isinstance(html, str)
         assert len(html) > 0
         # Should contain HTML from the sample markdown
         assert "<h1>" in html or "<p>" in html
     
-    def test_convert_file_not_found(self, tmp_path):
+    def test_convert_file_not_found(self, md_processor, tmp_path):
         """Test that convert_file raises error for non-existent file."""
-        processor = MarkdownProcessor()
         non_existent = tmp_path / "nonexistent.md"
         
         with pytest.raises(MarkdownProcessorError) as exc_info:
-            processor.convert_file(str(non_existent))
+            md_processor.convert_file(str(non_existent))
         assert "not found" in str(exc_info.value).lower()
     
-    def test_convert_file_custom_encoding(self, tmp_path):
+    def test_convert_file_custom_encoding(self, md_processor, temp_markdown_file):
         """Test converting file with custom encoding."""
-        processor = MarkdownProcessor()
-        md_file = tmp_path / "test.md"
-        md_file.write_text("# Test\n\nContent", encoding='utf-8')
-        
-        html = processor.convert_file(str(md_file), encoding='utf-8')
-        assert "<h1>Test</h1>" in html
+        html = md_processor.convert_file(str(temp_markdown_file), encoding='utf-8')
+        assert "<h1>Sample Page Title</h1>" in html
     
-    def test_convert_file_with_complex_content(self, tmp_path, sample_markdown_content):
-        """Test converting file with complex Markdown content."""
-        processor = MarkdownProcessor()
-        md_file = tmp_path / "complex.md"
-        md_file.write_text(sample_markdown_content, encoding='utf-8')
+    def test_convert_file_with_complex_content(
+        self, md_processor, temp_markdown_file, sample_markdown_html
+    ):
+        """Test that converting a file matches converting its content directly."""
+        html = md_processor.convert_file(str(temp_markdown_file))
         
-        html = processor.convert_file(str(md_file))
-        
-        # Verify various elements are present
-        assert "<h1>" in html or "<h2>" in html
-        assert "<p>" in html
-        assert "<ul>" in html or "<ol>" in html
-        assert "<table>" in html
-        assert "<pre>" in html or "<code>" in html
+        # The elements themselves are checked in test_full_page_conversion
+        assert html == sample_markdown_html
 
 
 @pytest.mark.unit
 class TestMarkdownProcessorExtensions:
     """Test cases for Markdown extensions functionality."""
     
-    def test_tables_extension_works(self):
+    def test_tables_extension_works(self, md_processor):
         """Test that tables extension is working."""
-        processor = MarkdownProcessor()
         markdown = """| A | B |
 |---|---|
 | 1 | 2 |"""
-        html = processor.convert(markdown)
-        assert "<table>" in html
-        assert "<thead>" in html
-        assert "<tbody>" in html
+        html = md_processor.convert(markdown)
+        assert_contains_all(html, ["<table>", "<thead>", "<tbody>"])
     
-    def test_fenced_code_extension_works(self):
+    def test_fenced_code_extension_works(self, md_processor):
         """Test that fenced_code extension is working."""
-        processor = MarkdownProcessor()
         markdown = """```python
 print("Hello")
 ```"""
-        html = processor.convert(markdown)
+        html = md_processor.convert(markdown)
         assert "<pre>" in html
         assert "<code" in html
     
-    def test_codehilite_extension_works(self):
+    def test_codehilite_extension_works(self, md_processor):
         """Test that codehilite extension is working."""
-        processor = MarkdownProcessor()
         markdown = """```python
 def test():
     return True
 ```"""
-        html = processor.convert(markdown)
+        html = md_processor.convert(markdown)
         # codehilite should add classes even if pygments is not used
         assert "<pre>" in html
         assert "<code" in html
@@ -318,32 +353,30 @@ def test():
 class TestMarkdownProcessorErrorHandling:
     """Test cases for error handling in MarkdownProcessor."""
     
-    def test_convert_handles_malformed_markdown_gracefully(self):
+    def test_convert_handles_malformed_markdown_gracefully(self, md_processor):
         """Test that convert handles malformed Markdown gracefully."""
-        processor = MarkdownProcessor()
         # Malformed markdown should still produce some output
         markdown = "**unclosed bold\n\n[unclosed link"
-        html = processor.convert(markdown)
+        html = md_processor.convert(markdown)
         assert isinstance(html, str)
         assert len(html) > 0
     
-    def test_error_message_includes_context(self):
+    def test_error_message_includes_context(self, md_processor):
         """Test that error messages include helpful context."""
-        processor = MarkdownProcessor()
         with pytest.raises(MarkdownProcessorError) as exc_info:
-            processor.convert(123)  # type: ignore
+            md_processor.convert(123)  # type: ignore
         error_msg = str(exc_info.value)
         assert "string" in error_msg.lower()
 
 
 @pytest.mark.integration
+@pytest.mark.slow
 class TestMarkdownProcessorIntegration:
     """Integration tests for MarkdownProcessor with real-world scenarios."""
     
-    def test_full_page_conversion(self, sample_markdown_content):
+    def test_full_page_conversion(self, sample_markdown_html):
         """Test converting a full page of Markdown content."""
-        processor = MarkdownProcessor()
-        html = processor.convert(sample_markdown_content)
+        html = sample_markdown_html
         
         # Verify all major elements are present
         assert "<h1>" in html or "<h2>" in html  # Headings
@@ -353,14 +386,81 @@ class TestMarkdownProcessorIntegration:
         assert "<pre>" in html or "<code>" in html  # Code blocks
         assert "<img" in html or "<a" in html  # Images or links
     
-    def test_multiple_conversions_same_processor(self):
-        """Test that same processor can handle multiple conversions."""
-        processor = MarkdownProcessor()
+    def test_full_page_conversion_benchmark(
+        self, request, md_processor, sample_markdown_content, sample_markdown_html
+    ):
+        """Benchmark converting a full page; needs the pytest-benchmark plugin."""
+        pytest.importorskip("pytest_benchmark")
+        benchmark = request.getfixturevalue("benchmark")
+        
+        html = benchmark(md_processor.convert, sample_markdown_content)
         
-        html1 = processor.convert("# First Document\n\nContent 1")
-        html2 = processor.convert("# Second Document\n\nContent 2")
+        assert html == sample_markdown_html
+    
+    def test_multiple_conversions_same_processor(self, md_processor):
+        """Test that same processor can handle multiple conversions."""
+        html1 = md_processor.convert("# First Document\n\nContent 1")
+        html2 = md_processor.convert("# Second Document\n\nContent 2")
         
         assert "<h1>First Document</h1>" in html1
         assert "<h1>Second Document</h1>" in html2
         assert html1 != html2
+    
+    def test_conversions_do_not_share_state(self):
+        """Test that a reused processor forgets earlier documents' link references."""
+        processor = MarkdownProcessor()
+        first = processor.convert("[Example][ref]\n\n[ref]: https://example.com")
+        second = processor.convert("[Example][ref]")
+        
+        assert 'href="https://example.com"' in first
+        assert "href" not in second
+
+
+def _structure(html):
+    """Return the text of headings, list items, table cells and links in html."""
+    from bs4 import BeautifulSoup
+    soup = BeautifulSoup(html, "html.parser")
+    return [
+        (tag.name, tag.get_text(strip=True))
+        for tag in soup.find_all(["h1", "h2", "h3", "li", "th", "td", "a"])
+    ]
+
 
+@pytest.mark.unit
+class TestMarkdownProcessorBackend:
+    """Test cases for the optional cmarkgfm backend."""
+    
+    def test_cmark_backend_falls_back_when_missing(self, monkeypatch):
+        """Test that MARKDOWN_BACKEND=cmark uses markdown if cmarkgfm is absent."""
+        monkeypatch.setenv('MARKDOWN_BACKEND', 'cmark')
+        monkeypatch.setattr('confluence2eml.core.markdown_processor.cmarkgfm', None)
+        processor = MarkdownProcessor()
+        
+        assert processor.use_cmark is False
+        assert "<h1>Title</h1>" in processor.convert("# Title")
+    
+    @pytest.mark.parametrize("kwargs", [
+        {'extensions': ['tables']},
+        {'extension_configs': {'codehilite': {'linenums': True}}},
+    ], ids=["extensions", "extension_configs"])
+    def test_cmark_backend_warns_about_ignored_extensions(self, monkeypatch, caplog, kwargs):
+        """Test that extensions requested with MARKDOWN_BACKEND=cmark are reported."""
+        monkeypatch.setenv('MARKDOWN_BACKEND', 'cmark')
+        monkeypatch.setattr('confluence2eml.core.markdown_processor.cmarkgfm', object())
+        
+        with caplog.at_level('WARNING', logger='confluence2eml.core.markdown_processor'):
+            processor = MarkdownProcessor(**kwargs)
+        
+        assert processor.use_cmark is True
+        assert "ignores the requested extensions" in caplog.text
+    
+    def test_backend_parity(self, monkeypatch, sample_markdown_content, sample_markdown_html):
+        """Test that both backends render the same document structure."""
+        pytest.importorskip("cmarkgfm")
+        monkeypatch.setenv('MARKDOWN_BACKEND', 'cmark')
+        processor = MarkdownProcessor()
+        
+        assert processor.use_cmark is True
+        assert _structure(processor.convert(sample_markdown_content)) == _structure(
+            sample_markdown_html
+        )
@@ -1,46 +1,81 @@
 """Integration tests for Markdown file saving in the main workflow."""
 
+from types import SimpleNamespace
+
 import pytest
 from pathlib import Path
-from unittest.mock import patch, MagicMock
 
 from confluence2eml.core.utils import generate_markdown_filename, save_markdown_file
 from confluence2eml.core.client import ConfluenceClient
 
 
+# Storage-format body the mocked REST API serves for the page, and the
+# Markdown ConfluenceClient derives from it
+PAGE_STORAGE = '<h1>Test Page</h1>\n<p>Content here.</p>'
+PAGE_MARKDOWN = '# Test Page\nContent here.'
+
+
+@pytest.fixture
+def mocked_confluence_client(mock_credentials, monkeypatch):
+    """Return a ConfluenceClient served a canned page, and the expected Markdown.
+    
+    requests.get is replaced for the test, so get_page_content() never
+    leaves the process.
+    """
+    page_data = {
+        'title': 'Test Page',
+        'body': {'storage': {'value': PAGE_STORAGE}},
+        '_links': {'webui': '/spaces/SPACE/pages/123456'},
+    }
+    response = SimpleNamespace(status_code=200, text="", json=lambda: page_data)
+    monkeypatch.setattr(
+        'confluence2eml.core.client.requests.get', lambda *args, **kwargs: response
+    )
+    client = ConfluenceClient(
+        base_url="https://company.atlassian.net",
+        user=mock_credentials["user"],
+        token=mock_credentials["token"]
+    )
+    return client, PAGE_MARKDOWN
+
+
+# Page titles whose Markdown filenames must be sanitized, with the file
+# name generate_markdown_filename() gives each
+TEST_TITLES = [
+    ("Simple Page Title", "Simple Page Title.md"),
+    ("Page: With/Invalid\\Chars?", "Page With Invalid Chars.md"),
+    ("Page <Important>", "Page Important.md"),
+    ("Page with émojis 🎉", "Page with émojis 🎉.md"),
+    ("  Page with spaces  ", "Page with spaces.md"),
+    ("Page...with...dots...", "Page...with...dots.md"),
+]
+
+
 @pytest.mark.integration
 class TestMarkdownSavingIntegration:
     """Integration tests for Markdown file saving in complete workflow."""
     
+    @pytest.mark.parametrize("title,expected_name", [
+        pytest.param(title, expected_name, id=title[:20])
+        for title, expected_name in TEST_TITLES
+    ])
     def test_markdown_saving_with_various_titles(
-        self, temp_output_dir, mock_credentials, sample_markdown_content
+        self, title, expected_name, temp_output_dir, sample_markdown_content,
+        sample_markdown_bytes
     ):
         """Test Markdown file saving with various page titles."""
-        test_titles = [
-            "Simple Page Title",
-            "Page: With/Invalid\\Chars?",
-            "Page <Important>",
-            "Page with émojis 🎉",
-            "  Page with spaces  ",
-            "Page...with...dots...",
-        ]
+        # Generate filename
+        markdown_path = generate_markdown_filename(title, temp_output_dir)
+        
+        # Save content
+        saved_path = save_markdown_file(sample_markdown_content, markdown_path)
+        
+        # Verify file exists and has correct content
+        assert saved_path.exists(), f"File should exist for title: {title}"
+        assert saved_path.read_bytes() == sample_markdown_bytes
         
-        for title in test_titles:
-            # Generate filename
-            markdown_path = generate_markdown_filename(title, temp_output_dir)
-            
-            # Save content
-            saved_path = save_markdown_file(sample_markdown_content, markdown_path)
-            
-            # Verify file exists and has correct content
-            assert saved_path.exists(), f"File should exist for title: {title}"
-            assert saved_path.read_text(encoding='utf-8') == sample_markdown_content
-            assert saved_path.suffix == ".md"
-            
-            # Verify filename is sanitized
-            assert ":" not in saved_path.name
-            assert "/" not in saved_path.name
-            assert "\\" not in saved_path.name
+        # Verify filename is sanitized
+        assert saved_path.name == expected_name
     
     def test_markdown_saving_in_output_directory(self, tmp_path, mock_credentials):
         """Test that Markdown file is saved in the same directory as EML output."""
@@ -61,60 +96,38 @@ class TestMarkdownSavingIntegration:
         assert markdown_path.exists()
         assert markdown_path.name == "Test Page Title.md"
     
-    def test_markdown_saving_with_empty_title(self, temp_output_dir, sample_markdown_content):
+    def test_markdown_saving_with_empty_title(
+        self, shared_output_dir, sample_markdown_content, sample_markdown_bytes
+    ):
         """Test Markdown file saving handles empty page title."""
-        markdown_path = generate_markdown_filename("", temp_output_dir)
+        # No other test saves an untitled page to shared_output_dir
+        markdown_path = generate_markdown_filename("", shared_output_dir)
         
         save_markdown_file(sample_markdown_content, markdown_path)
         
         assert markdown_path.exists()
         assert markdown_path.name == "untitled.md"
-        assert markdown_path.read_text(encoding='utf-8') == sample_markdown_content
+        assert markdown_path.read_bytes() == sample_markdown_bytes
     
-    def test_markdown_saving_with_very_long_title(self, temp_output_dir, sample_markdown_content):
+    def test_markdown_saving_with_very_long_title(
+        self, shared_output_dir, sample_markdown_content, sample_markdown_bytes
+    ):
         """Test Markdown file saving handles very long page titles."""
         long_title = "A" * 500  # Very long title
-        markdown_path = generate_markdown_filename(long_title, temp_output_dir)
+        markdown_path = generate_markdown_filename(long_title, shared_output_dir)
         
         save_markdown_file(sample_markdown_content, markdown_path)
         
         assert markdown_path.exists()
         # Filename should be truncated but still valid
         assert len(markdown_path.name) <= 200 + len(".md")  # max_length + extension
-        assert markdown_path.read_text(encoding='utf-8') == sample_markdown_content
+        assert markdown_path.read_bytes() == sample_markdown_bytes
     
-    @patch('confluence2eml.core.client.subprocess')
-    @patch('confluence2eml.core.client.Path')
-    @patch('confluence2eml.core.client.tempfile')
     def test_complete_workflow_with_markdown_saving(
-        self, mock_tempfile, mock_path_class, mock_subprocess,
-        temp_output_dir, mock_credentials, sample_markdown_content
+        self, mocked_confluence_client, temp_output_dir
     ):
         """Test complete workflow including Markdown file saving."""
-        # Setup mocks for ConfluenceClient
-        mock_tmp_file = MagicMock()
-        mock_tmp_file.name = "/tmp/test.md"
-        mock_tempfile.NamedTemporaryFile.return_value.__enter__.return_value = mock_tmp_file
-        mock_tempfile.NamedTemporaryFile.return_value.__exit__.return_value = None
-        
-        mock_path_instance = MagicMock()
-        mock_path_instance.read_text.return_value = sample_markdown_content
-        mock_path_instance.unlink.return_value = None
-        mock_path_class.return_value = mock_path_instance
-        
-        mock_result = MagicMock()
-        mock_result.returncode = 0
-        mock_result.stdout = ""
-        mock_result.stderr = ""
-        mock_subprocess.run.return_value = mock_result
-        
-        # Create client and get content
-        client = ConfluenceClient(
-            base_url="https://company.atlassian.net",
-            user=mock_credentials["user"],
-            token=mock_credentials["token"]
-        )
-        client._exporter = None
+        client, expected_content = mocked_confluence_client
         
         # Get page content
         page_content = client.get_page_content("123456")
@@ -129,6 +142,5 @@ class TestMarkdownSavingIntegration:
         
         # Verify Markdown file was saved
         assert saved_path.exists()
-        assert saved_path.read_text(encoding='utf-8') == sample_markdown_content
-        assert saved_path.suffix == ".md"
-
+        assert saved_path.read_bytes() == expected_content.encode('utf-8')
+        assert saved_path.name == "Test Page.md"
@@ -2,6 +2,7 @@
 
 import email
 import pytest
+from email.parser import BytesHeaderParser
 from pathlib import Path
 
 from confluence2eml.core.mime_generator import (
@@ -11,6 +12,24 @@ from confluence2eml.core.mime_generator import (
 from confluence2eml.core.image_processor import ImageData
 
 
+def _parts_by_type(msg):
+    """Return the parts of msg (including msg itself) grouped by content type."""
+    parts = {}
+    for part in msg.walk():
+        parts.setdefault(part.get_content_type(), []).append(part)
+    return parts
+
+
+@pytest.fixture(scope="module")
+def generator():
+    """Return a MimeGenerator with the default addresses.
+    
+    create_message() and save_to_file() keep no per-message state, so one
+    instance is shared by every test in this module that uses the defaults.
+    """
+    return MimeGenerator()
+
+
 @pytest.mark.unit
 class TestMimeGeneratorInitialization:
     """Test cases for MimeGenerator initialization."""
@@ -36,9 +55,8 @@ class TestMimeGeneratorInitialization:
 class TestMimeGeneratorCreateMessage:
     """Test cases for MimeGenerator.create_message method."""
     
-    def test_create_message_basic(self):
+    def test_create_message_basic(self, generator):
         """Test creating a basic message with HTML content."""
-        generator = MimeGenerator()
         msg = generator.create_message(
             subject="Test Subject",
             html_content="<h1>Hello</h1><p>World</p>"
@@ -51,9 +69,8 @@ class TestMimeGeneratorCreateMessage:
         assert 'Message-ID' in msg
         assert msg.is_multipart()
     
-    def test_create_message_with_custom_addresses(self):
+    def test_create_message_with_custom_addresses(self, generator):
         """Test creating message with custom from/to addresses."""
-        generator = MimeGenerator()
         msg = generator.create_message(
             subject="Test",
             html_content="<p>Content</p>",
@@ -64,9 +81,8 @@ class TestMimeGeneratorCreateMessage:
         assert msg['From'] == "sender@example.com"
         assert msg['To'] == "recipient@example.com"
     
-    def test_create_message_with_plain_text(self):
+    def test_create_message_with_plain_text(self, generator):
         """Test creating message with explicit plain text."""
-        generator = MimeGenerator()
         msg = generator.create_message(
             subject="Test",
             html_content="<h1>HTML</h1>",
@@ -76,23 +92,16 @@ class TestMimeGeneratorCreateMessage:
         # Should have both plain text and HTML
         assert msg.is_multipart()
         
-        # Get the plain text part
-        plain_part = None
-        html_part = None
-        for part in msg.walk():
-            if part.get_content_type() == 'text/plain':
-                plain_part = part
-            elif part.get_content_type() == 'text/html':
-                html_part = part
+        # Get the plain text and HTML parts
+        parts = _parts_by_type(msg)
         
-        assert plain_part is not None
-        assert html_part is not None
-        assert "Plain Text Version" in plain_part.get_content()
-        assert "<h1>HTML</h1>" in html_part.get_content()
+        assert parts.get('text/plain')
+        assert parts.get('text/html')
+        assert "Plain Text Version" in parts['text/plain'][0].get_content()
+        assert "<h1>HTML</h1>" in parts['text/html'][0].get_content()
     
-    def test_create_message_auto_generates_plain_text(self):
+    def test_create_message_auto_generates_plain_text(self, generator):
         """Test that plain text is auto-generated from HTML if not provided."""
-        generator = MimeGenerator()
         msg = generator.create_message(
             subject="Test",
             html_content="<h1>Title</h1><p>Paragraph with <strong>bold</strong> text.</p>"
@@ -102,14 +111,10 @@ class TestMimeGeneratorCreateMessage:
         assert msg.is_multipart()
         
         # Get the plain text part
-        plain_part = None
-        for part in msg.walk():
-            if part.get_content_type() == 'text/plain':
-                plain_part = part
-                break
+        plain_parts = _parts_by_type(msg).get('text/plain')
         
-        assert plain_part is not None
-        content = plain_part.get_content()
+        assert plain_parts
+        content = plain_parts[0].get_content()
         # Should have extracted text content (HTML tags removed)
         assert "Title" in content
         assert "Paragraph" in content
@@ -118,9 +123,8 @@ class TestMimeGeneratorCreateMessage:
         assert "<h1>" not in content
         assert "<p>" not in content
     
-    def test_create_message_has_correct_content_type(self):
+    def test_create_message_has_correct_content_type(self, generator):
         """Test that message has correct multipart structure."""
-        generator = MimeGenerator()
         msg = generator.create_message(
             subject="Test",
             html_content="<p>Content</p>"
@@ -131,9 +135,8 @@ class TestMimeGeneratorCreateMessage:
         content_type = msg.get_content_type()
         assert 'multipart' in content_type
     
-    def test_create_message_has_message_id(self):
+    def test_create_message_has_message_id(self, generator):
         """Test that message has a Message-ID header."""
-        generator = MimeGenerator()
         msg = generator.create_message(
             subject="Test",
             html_content="<p>Content</p>"
@@ -145,9 +148,8 @@ class TestMimeGeneratorCreateMessage:
         assert msg_id.endswith('>')
         assert 'confluence-export' in msg_id
     
-    def test_create_message_has_date(self):
+    def test_create_message_has_date(self, generator):
         """Test that message has a Date header."""
-        generator = MimeGenerator()
         msg = generator.create_message(
             subject="Test",
             html_content="<p>Content</p>"
@@ -158,9 +160,8 @@ class TestMimeGeneratorCreateMessage:
         assert date is not None
         assert len(date) > 0
     
-    def test_create_message_with_custom_date(self):
+    def test_create_message_with_custom_date(self, generator):
         """Test creating message with custom date."""
-        generator = MimeGenerator()
         custom_date = "Mon, 01 Jan 2024 12:00:00 +0000"  # Use zero-padded day
         msg = generator.create_message(
             subject="Test",
@@ -170,9 +171,18 @@ class TestMimeGeneratorCreateMessage:
         
         assert msg['Date'] == custom_date
     
-    def test_create_message_empty_html(self):
+    def test_create_message_is_repeatable(self, generator):
+        """Test that the shared generator builds the same body for the same input."""
+        kwargs = dict(subject="Test", html_content="<h1>Title</h1><p>Content</p>")
+        first = generator.create_message(**kwargs)
+        second = generator.create_message(**kwargs)
+        
+        assert [part.get_content() for part in first.iter_parts()] == [
+            part.get_content() for part in second.iter_parts()
+        ]
+    
+    def test_create_message_empty_html(self, generator):
         """Test creating message with empty HTML content."""
-        generator = MimeGenerator()
         msg = generator.create_message(
             subject="Test",
             html_content=""
@@ -186,9 +196,8 @@ class TestMimeGeneratorCreateMessage:
 class TestMimeGeneratorHtmlToPlainText:
     """Test cases for HTML to plain text conversion."""
     
-    def test_html_to_plain_text_simple(self):
+    def test_html_to_plain_text_simple(self, generator):
         """Test converting simple HTML to plain text."""
-        generator = MimeGenerator()
         html = "<h1>Title</h1><p>Paragraph text.</p>"
         text = generator._html_to_plain_text(html)
         
@@ -197,9 +206,8 @@ class TestMimeGeneratorHtmlToPlainText:
         assert "<h1>" not in text
         assert "<p>" not in text
     
-    def test_html_to_plain_text_with_bold(self):
+    def test_html_to_plain_text_with_bold(self, generator):
         """Test converting HTML with bold text."""
-        generator = MimeGenerator()
         html = "<p>This is <strong>bold</strong> text.</p>"
         text = generator._html_to_plain_text(html)
         
@@ -208,9 +216,8 @@ class TestMimeGeneratorHtmlToPlainText:
         assert "text" in text
         assert "<strong>" not in text
     
-    def test_html_to_plain_text_removes_scripts(self):
+    def test_html_to_plain_text_removes_scripts(self, generator):
         """Test that script tags are removed."""
-        generator = MimeGenerator()
         html = "<p>Content</p><script>alert('xss')</script><p>More content</p>"
         text = generator._html_to_plain_text(html)
         
@@ -219,23 +226,34 @@ class TestMimeGeneratorHtmlToPlainText:
         assert "alert" not in text
         assert "<script>" not in text
     
-    def test_html_to_plain_text_handles_entities(self):
+    def test_html_to_plain_text_removes_styles(self, generator):
+        """Test that style tags are removed, whatever their case."""
+        html = "<STYLE type='text/css'>p { color: red; }</style><p>Content</p>"
+        text = generator._html_to_plain_text(html)
+        
+        assert text == "Content"
+    
+    def test_html_to_plain_text_handles_entities(self, generator):
         """Test that HTML entities are decoded."""
-        generator = MimeGenerator()
         html = "<p>Text with &amp; and &lt;tags&gt;</p>"
         text = generator._html_to_plain_text(html)
         
         assert "&" in text or "and" in text
         assert "<tags>" in text or "tags" in text
+    
+    def test_html_to_plain_text_without_markup(self, generator):
+        """Test that text with no tags or entities is returned stripped."""
+        text = generator._html_to_plain_text("  Just text, no markup.\n")
+        
+        assert text == "Just text, no markup."
 
 
 @pytest.mark.unit
 class TestMimeGeneratorSaveToFile:
     """Test cases for MimeGenerator.save_to_file method."""
     
-    def test_save_to_file(self, temp_output_dir):
+    def test_save_to_file(self, generator, temp_output_dir):
         """Test saving a message to a file."""
-        generator = MimeGenerator()
         msg = generator.create_message(
             subject="Test",
             html_content="<h1>Hello</h1>"
@@ -248,9 +266,8 @@ class TestMimeGeneratorSaveToFile:
         assert output_path.exists()
         assert output_path.stat().st_size > 0
     
-    def test_save_to_file_creates_directory(self, tmp_path):
+    def test_save_to_file_creates_directory(self, generator, tmp_path):
         """Test that save_to_file creates parent directories."""
-        generator = MimeGenerator()
         msg = generator.create_message(
             subject="Test",
             html_content="<p>Content</p>"
@@ -262,9 +279,8 @@ class TestMimeGeneratorSaveToFile:
         assert nested_path.exists()
         assert saved_path == nested_path
     
-    def test_save_to_file_can_be_parsed(self, temp_output_dir):
+    def test_save_to_file_can_be_parsed(self, generator, temp_output_dir):
         """Test that saved file can be parsed back as an EmailMessage."""
-        generator = MimeGenerator()
         original_msg = generator.create_message(
             subject="Test Subject",
             html_content="<h1>Test Content</h1>",
@@ -276,16 +292,14 @@ class TestMimeGeneratorSaveToFile:
         
         # Parse the file back
         with open(output_path, 'rb') as f:
-            parsed_msg = email.message_from_bytes(f.read())
+            parsed_msg = email.message_from_binary_file(f)
         
         assert parsed_msg['Subject'] == "Test Subject"
         assert parsed_msg.is_multipart()
         assert parsed_msg.get_content_type().startswith('multipart')
     
-    def test_save_to_file_overwrites_existing(self, temp_output_dir):
+    def test_save_to_file_overwrites_existing(self, generator, temp_output_dir):
         """Test that save_to_file overwrites existing files."""
-        generator = MimeGenerator()
-        
         output_path = temp_output_dir / "test.eml"
         
         # Create first message
@@ -302,9 +316,9 @@ class TestMimeGeneratorSaveToFile:
         )
         generator.save_to_file(msg2, str(output_path))
         
-        # Parse and verify it's the second message
+        # Parse the headers and verify it's the second message
         with open(output_path, 'rb') as f:
-            parsed_msg = email.message_from_bytes(f.read())
+            parsed_msg = BytesHeaderParser().parse(f)
         
         assert parsed_msg['Subject'] == "Second"
 
@@ -313,10 +327,8 @@ class TestMimeGeneratorSaveToFile:
 class TestMimeGeneratorCreateAndSave:
     """Test cases for MimeGenerator.create_and_save convenience method."""
     
-    def test_create_and_save(self, temp_output_dir):
+    def test_create_and_save(self, generator, temp_output_dir):
         """Test create_and_save convenience method."""
-        generator = MimeGenerator()
-        
         output_path = temp_output_dir / "test.eml"
         saved_path = generator.create_and_save(
             subject="Test Subject",
@@ -329,15 +341,13 @@ class TestMimeGeneratorCreateAndSave:
         
         # Verify the file can be parsed
         with open(output_path, 'rb') as f:
-            msg = email.message_from_bytes(f.read())
+            msg = email.message_from_binary_file(f)
         
         assert msg['Subject'] == "Test Subject"
         assert msg.is_multipart()
     
-    def test_create_and_save_with_plain_text(self, temp_output_dir):
+    def test_create_and_save_with_plain_text(self, generator, temp_output_dir):
         """Test create_and_save with explicit plain text."""
-        generator = MimeGenerator()
-        
         output_path = temp_output_dir / "test.eml"
         saved_path = generator.create_and_save(
             subject="Test",
@@ -350,22 +360,20 @@ class TestMimeGeneratorCreateAndSave:
         
         # Verify both parts are present
         with open(output_path, 'rb') as f:
-            msg = email.message_from_bytes(f.read())
+            msg = email.message_from_binary_file(f)
         
         assert msg.is_multipart()
-        parts = list(msg.walk())
-        content_types = [part.get_content_type() for part in parts]
-        assert 'text/plain' in content_types
-        assert 'text/html' in content_types
+        parts = _parts_by_type(msg)
+        assert 'text/plain' in parts
+        assert 'text/html' in parts
 
 
 @pytest.mark.unit
 class TestMimeGeneratorErrorHandling:
     """Test cases for error handling in MimeGenerator."""
     
-    def test_create_message_with_invalid_subject(self):
+    def test_create_message_with_invalid_subject(self, generator):
         """Test that create_message handles various subject formats."""
-        generator = MimeGenerator()
         # Should not raise an error even with special characters
         msg = generator.create_message(
             subject="Test: Subject with <special> chars & symbols",
@@ -374,9 +382,8 @@ class TestMimeGeneratorErrorHandling:
         
         assert msg['Subject'] == "Test: Subject with <special> chars & symbols"
     
-    def test_save_to_file_invalid_path(self):
+    def test_save_to_file_invalid_path(self, generator):
         """Test that save_to_file raises error for invalid paths."""
-        generator = MimeGenerator()
         msg = generator.create_message(
             subject="Test",
             html_content="<p>Content</p>"
@@ -438,7 +445,7 @@ This is **bold** and *italic* text.
         
         # Verify the EML file
         with open(saved_path, 'rb') as f:
-            msg = email.message_from_bytes(f.read())
+            msg = email.message_from_binary_file(f)
         
         assert msg['Subject'] == "Confluence Export: Sample Page"
         assert msg.is_multipart()
@@ -456,10 +463,8 @@ This is **bold** and *italic* text.
         
         assert html_found
     
-    def test_eml_file_structure(self, temp_output_dir):
+    def test_eml_file_structure(self, generator, temp_output_dir):
         """Test that generated EML file has correct structure."""
-        generator = MimeGenerator()
-        
         output_path = temp_output_dir / "test.eml"
         generator.create_and_save(
             subject="Test Email",
@@ -469,25 +474,22 @@ This is **bold** and *italic* text.
         
         # Parse the file
         with open(output_path, 'rb') as f:
-            msg = email.message_from_bytes(f.read())
+            msg = email.message_from_binary_file(f)
         
         # Check structure
         assert msg.is_multipart()
         assert msg.get_content_type().startswith('multipart')
         
         # Check parts
-        parts = list(msg.walk())
-        assert len(parts) >= 2  # At least plain text and HTML
+        parts = _parts_by_type(msg)
+        assert sum(map(len, parts.values())) >= 2  # At least plain text and HTML
         
         # Verify we have both text/plain and text/html
-        content_types = [part.get_content_type() for part in parts]
-        assert 'text/plain' in content_types
-        assert 'text/html' in content_types
+        assert 'text/plain' in parts
+        assert 'text/html' in parts
     
-    def test_multiple_messages_same_generator(self, temp_output_dir):
+    def test_multiple_messages_same_generator(self, generator, temp_output_dir):
         """Test that same generator can create multiple messages."""
-        generator = MimeGenerator()
-        
         # Create first message
         path1 = temp_output_dir / "msg1.eml"
         generator.create_and_save(
@@ -509,9 +511,9 @@ This is **bold** and *italic* text.
         assert path2.exists()
         
         with open(path1, 'rb') as f:
-            msg1 = email.message_from_bytes(f.read())
+            msg1 = BytesHeaderParser().parse(f)
         with open(path2, 'rb') as f:
-            msg2 = email.message_from_bytes(f.read())
+            msg2 = BytesHeaderParser().parse(f)
         
         assert msg1['Subject'] == "Message 1"
         assert msg2['Subject'] == "Message 2"
@@ -522,10 +524,8 @@ This is **bold** and *italic* text.
 class TestMimeGeneratorCIDAttachments:
     """Test cases for CID attachment functionality."""
     
-    def test_create_message_with_cid_images(self):
+    def test_create_message_with_cid_images(self, generator):
         """Test creating message with CID-embedded images."""
-        generator = MimeGenerator()
-        
         # Create mock ImageData objects
         from email.utils import make_msgid
         image1 = ImageData(
@@ -559,10 +559,8 @@ class TestMimeGeneratorCIDAttachments:
         
         assert len(image_parts) == 2
     
-    def test_create_message_with_cid_images_verifies_cid(self):
+    def test_create_message_with_cid_images_verifies_cid(self, generator):
         """Test that CID images have correct Content-ID headers."""
-        generator = MimeGenerator()
-        
         from email.utils import make_msgid
         cid = make_msgid(domain='test')
         image = ImageData(
@@ -594,9 +592,8 @@ class TestMimeGeneratorCIDAttachments:
         cid_value = cid[1:-1] if cid.startswith('<') and cid.endswith('>') else cid
         assert cid_value in content_id or cid in content_id
     
-    def test_create_message_with_no_images(self):
+    def test_create_message_with_no_images(self, generator):
         """Test creating message without images (images=None)."""
-        generator = MimeGenerator()
         msg = generator.create_message(
             subject="Test",
             html_content="<p>No images</p>",
@@ -611,9 +608,8 @@ class TestMimeGeneratorCIDAttachments:
         image_parts = [p for p in msg.walk() if p.get_content_maintype() == 'image']
         assert len(image_parts) == 0
     
-    def test_create_message_with_empty_images_list(self):
+    def test_create_message_with_empty_images_list(self, generator):
         """Test creating message with empty images list."""
-        generator = MimeGenerator()
         msg = generator.create_message(
             subject="Test",
             html_content="<p>No images</p>",
@@ -628,10 +624,8 @@ class TestMimeGeneratorCIDAttachments:
         image_parts = [p for p in msg.walk() if p.get_content_maintype() == 'image']
         assert len(image_parts) == 0
     
-    def test_create_and_save_with_cid_images(self, temp_output_dir):
+    def test_create_and_save_with_cid_images(self, generator, temp_output_dir):
         """Test create_and_save with CID images."""
-        generator = MimeGenerator()
-        
         from email.utils import make_msgid
         image = ImageData(
             cid=make_msgid(domain='test'),
@@ -652,15 +646,13 @@ class TestMimeGeneratorCIDAttachments:
         
         # Verify the saved file contains the image
         with open(path, 'rb') as f:
-            msg = email.message_from_bytes(f.read())
+            msg = email.message_from_binary_file(f)
         
         image_parts = [p for p in msg.walk() if p.get_content_maintype() == 'image']
         assert len(image_parts) == 1
     
-    def test_create_message_handles_image_attachment_error(self):
+    def test_create_message_handles_image_attachment_error(self, generator):
         """Test that image attachment errors don't crash the message creation."""
-        generator = MimeGenerator()
-        
         # Create an invalid ImageData (missing required attributes)
         # This will cause an error when trying to attach
         class InvalidImageData:
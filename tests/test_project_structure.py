@@ -4,6 +4,9 @@ This test verifies that the project structure is set up correctly
 and basic imports work as expected.
 """
 
+import functools
+import os
+import re
 import sys
 from pathlib import Path
 
@@ -38,9 +41,28 @@ def test_project_structure():
         "confluence2eml/core/__init__.py",
     ]
     
+    # One listing per directory rather than one stat per file
+    listings = {}
+    missing = []
     for file_path in required_files:
-        full_path = project_root / file_path
-        assert full_path.exists(), f"Required file {file_path} should exist"
+        directory, _, name = file_path.rpartition("/")
+        if directory not in listings:
+            listings[directory] = set(os.listdir(project_root / directory))
+        if name not in listings[directory]:
+            missing.append(file_path)
+    
+    assert not missing, f"Required files should exist: {missing}"
+
+
+@functools.lru_cache(maxsize=1)
+def _requirement_names():
+    """Return the package names listed in requirements.txt, lowercased."""
+    names = set()
+    for line in (project_root / "requirements.txt").read_text().splitlines():
+        line = line.split("#", 1)[0].strip()
+        if line:
+            names.add(re.split(r"[\s<>=!~;\[]", line, maxsplit=1)[0].lower())
+    return frozenset(names)
 
 
 def test_dependencies_listed():
@@ -48,7 +70,6 @@ def test_dependencies_listed():
     requirements_file = project_root / "requirements.txt"
     assert requirements_file.exists()
     
-    content = requirements_file.read_text()
     required_deps = [
         "confluence-markdown-exporter",
         "markdown",
@@ -57,6 +78,7 @@ def test_dependencies_listed():
         "requests",
     ]
     
+    # Match whole package names, not substrings of other requirements
+    names = _requirement_names()
     for dep in required_deps:
-        assert dep in content, f"Dependency {dep} should be in requirements.txt"
-
+        assert dep in names, f"Dependency {dep} should be in requirements.txt"
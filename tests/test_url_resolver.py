@@ -64,6 +64,14 @@ class TestURLResolver:
          "https://confluence.company.com"),
         ("http://localhost:8090/wiki/spaces/SPACE/pages/123456", 
          "http://localhost:8090"),
+        ("https://company.atlassian.net?pageId=123456",
+         "https://company.atlassian.net"),
+        ("https://company.atlassian.net",
+         "https://company.atlassian.net"),
+        ("  https://company.atlassian.net/wiki/pages/123456",
+         "https://company.atlassian.net"),
+        ("HTTPS://company.atlassian.net/wiki/pages/123456",
+         "https://company.atlassian.net"),
     ])
     def test_extract_base_url(self, url, expected_base):
         """Test extracting base URL from various URL formats."""
@@ -76,8 +84,25 @@ class TestURLResolver:
             URLResolver.extract_base_url("")
         assert "URL cannot be empty" in str(exc_info.value)
     
+    @pytest.mark.parametrize("url", [None, 123, b"https://company.atlassian.net/wiki"],
+                             ids=["none", "int", "bytes"])
+    def test_extract_base_url_from_non_string_raises_error(self, url):
+        """Test that non-string URLs raise ConfluenceClientError."""
+        with pytest.raises(ConfluenceClientError):
+            URLResolver.extract_base_url(url)
+    
     def test_extract_base_url_from_invalid_raises_error(self):
         """Test that invalid URLs raise appropriate error."""
         with pytest.raises(ConfluenceClientError):
             URLResolver.extract_base_url("not-a-valid-url")
+    
+    def test_extract_base_url_without_host_raises_error(self):
+        """Test that URLs with an empty host raise appropriate error."""
+        with pytest.raises(ConfluenceClientError):
+            URLResolver.extract_base_url("https:///wiki/pages/123456")
+    
+    def test_extract_base_url_with_scheme_only_in_query_raises_error(self):
+        """Test that a '://' inside the query does not count as the URL's scheme."""
+        with pytest.raises(ConfluenceClientError):
+            URLResolver.extract_base_url("host/wiki?next=https://x/y")
 
@@ -10,82 +10,43 @@ from confluence2eml.core.utils import (
     load_email_css,
     wrap_html_with_css,
 )
+from tests.helpers import assert_contains_all
+
+
+# Deletes every character sanitize_filename must never leave in a name:
+# those invalid on common filesystems plus ASCII control characters
+INVALID_FILENAME_CHARS = str.maketrans(
+    '', '', '<>:"/\\|?*' + ''.join(map(chr, range(0x20)))
+)
 
 
 @pytest.mark.unit
 class TestSanitizeFilename:
     """Test cases for sanitize_filename function."""
     
-    def test_simple_title(self):
-        """Test sanitization of a simple, valid title."""
-        result = sanitize_filename("My Page Title")
-        assert result == "My Page Title"
-    
-    def test_title_with_invalid_chars(self):
-        """Test sanitization removes invalid filesystem characters."""
-        result = sanitize_filename('Page: With/Invalid\\Chars?')
-        assert ':' not in result
-        assert '/' not in result
-        assert '\\' not in result
-        assert '?' not in result
-        assert result == "Page With Invalid Chars"
-    
-    def test_title_with_angle_brackets(self):
-        """Test sanitization removes angle brackets."""
-        result = sanitize_filename("Page <Important>")
-        assert '<' not in result
-        assert '>' not in result
-        assert result == "Page Important"
-    
-    def test_title_with_quotes(self):
-        """Test sanitization removes quotes."""
-        result = sanitize_filename('Page "Quoted" Title')
-        assert '"' not in result
-        assert result == "Page Quoted Title"
-    
-    def test_title_with_pipe(self):
-        """Test sanitization removes pipe character."""
-        result = sanitize_filename("Page | Separated")
-        assert '|' not in result
-        assert result == "Page Separated"
-    
-    def test_title_with_asterisk(self):
-        """Test sanitization removes asterisk."""
-        result = sanitize_filename("Page * Important")
-        assert '*' not in result
-        assert result == "Page Important"
-    
-    def test_title_with_multiple_spaces(self):
-        """Test sanitization collapses multiple spaces."""
-        result = sanitize_filename("Page   With    Multiple    Spaces")
-        assert "  " not in result
-        assert result == "Page With Multiple Spaces"
-    
-    def test_title_with_leading_trailing_spaces(self):
-        """Test sanitization removes leading/trailing spaces."""
-        result = sanitize_filename("  Page Title  ")
-        assert result == "Page Title"
-    
-    def test_title_with_trailing_dots(self):
-        """Test sanitization removes trailing dots (Windows restriction)."""
-        result = sanitize_filename("Page Title...")
-        assert not result.endswith('.')
-        assert result == "Page Title"
-    
-    def test_empty_title(self):
-        """Test sanitization handles empty title."""
-        result = sanitize_filename("")
-        assert result == "untitled"
-    
-    def test_whitespace_only_title(self):
-        """Test sanitization handles whitespace-only title."""
-        result = sanitize_filename("   ")
-        assert result == "untitled"
-    
-    def test_title_with_only_invalid_chars(self):
-        """Test sanitization handles title with only invalid characters."""
-        result = sanitize_filename("<>:\"/\\|?*")
-        assert result == "untitled"
+    @pytest.mark.parametrize("raw,expected", [
+        pytest.param("My Page Title", "My Page Title", id="simple"),
+        pytest.param('Page: With/Invalid\\Chars?', "Page With Invalid Chars", id="invalid_chars"),
+        pytest.param("Page <Important>", "Page Important", id="angle_brackets"),
+        pytest.param('Page "Quoted" Title', "Page Quoted Title", id="quotes"),
+        pytest.param("Page | Separated", "Page Separated", id="pipe"),
+        pytest.param("Page * Important", "Page Important", id="asterisk"),
+        pytest.param("Page   With    Multiple    Spaces", "Page With Multiple Spaces",
+                     id="multiple_spaces"),
+        pytest.param("  Page Title  ", "Page Title", id="leading_trailing_spaces"),
+        # Windows does not allow trailing dots
+        pytest.param("Page Title...", "Page Title", id="trailing_dots"),
+        pytest.param("Page\x00With\x1fControl\x02Chars", "Page With Control Chars",
+                     id="control_characters"),
+        pytest.param("", "untitled", id="empty"),
+        pytest.param("   ", "untitled", id="whitespace_only"),
+        pytest.param("<>:\"/\\|?*", "untitled", id="only_invalid_chars"),
+    ])
+    def test_sanitize_filename(self, raw, expected):
+        """Test that titles are sanitized to the expected filename."""
+        result = sanitize_filename(raw)
+        assert result.translate(INVALID_FILENAME_CHARS) == result
+        assert result == expected
     
     def test_title_truncation(self):
         """Test sanitization truncates very long titles."""
@@ -96,16 +57,10 @@ class TestSanitizeFilename:
     def test_title_with_unicode(self):
         """Test sanitization preserves valid Unicode characters."""
         result = sanitize_filename("Page with émojis 🎉 and ñoño")
+        assert result.translate(INVALID_FILENAME_CHARS) == result
         # Unicode should be preserved (valid in most filesystems)
         assert "émojis" in result or "mojis" in result
         assert "ñoño" in result or "nono" in result
-    
-    def test_title_with_control_characters(self):
-        """Test sanitization removes control characters."""
-        result = sanitize_filename("Page\x00With\x1fControl\x02Chars")
-        assert '\x00' not in result
-        assert '\x1f' not in result
-        assert '\x02' not in result
 
 
 @pytest.mark.unit
@@ -148,17 +103,21 @@ class TestGenerateMarkdownFilename:
 class TestSaveMarkdownFile:
     """Test cases for save_markdown_file function."""
     
-    def test_save_markdown_file(self, temp_output_dir, sample_markdown_content):
+    def test_save_markdown_file(
+        self, shared_output_dir, sample_markdown_content, sample_markdown_bytes
+    ):
         """Test saving Markdown content to a file."""
-        filepath = temp_output_dir / "test_page.md"
+        filepath = shared_output_dir / "save_sample_page.md"
         
         saved_path = save_markdown_file(sample_markdown_content, filepath)
         
         assert saved_path == filepath
         assert filepath.exists()
-        assert filepath.read_text(encoding='utf-8') == sample_markdown_content
+        assert filepath.read_bytes() == sample_markdown_bytes
     
-    def test_save_markdown_file_creates_directory(self, tmp_path, sample_markdown_content):
+    def test_save_markdown_file_creates_directory(
+        self, tmp_path, sample_markdown_content, sample_markdown_bytes
+    ):
         """Test that save_markdown_file creates parent directories."""
         nested_dir = tmp_path / "nested" / "deep" / "path"
         filepath = nested_dir / "test_page.md"
@@ -171,9 +130,11 @@ class TestSaveMarkdownFile:
         # Directory should be created
         assert nested_dir.exists()
         assert filepath.exists()
-        assert saved_path.read_text(encoding='utf-8') == sample_markdown_content
+        assert saved_path.read_bytes() == sample_markdown_bytes
     
-    def test_save_markdown_file_overwrites_existing(self, temp_output_dir, sample_markdown_content):
+    def test_save_markdown_file_overwrites_existing(
+        self, temp_output_dir, sample_markdown_content, sample_markdown_bytes
+    ):
         """Test that save_markdown_file overwrites existing files."""
         filepath = temp_output_dir / "test_page.md"
         
@@ -185,26 +146,44 @@ class TestSaveMarkdownFile:
         saved_path = save_markdown_file(sample_markdown_content, filepath)
         
         # Content should be overwritten
-        assert saved_path.read_text(encoding='utf-8') == sample_markdown_content
-    
-    def test_save_markdown_file_unicode_content(self, temp_output_dir):
-        """Test saving Markdown file with Unicode content."""
-        unicode_content = "# Page with émojis 🎉\n\nContent with ñoño and 中文"
-        filepath = temp_output_dir / "unicode_page.md"
-        
-        saved_path = save_markdown_file(unicode_content, filepath)
-        
-        assert saved_path.exists()
-        assert saved_path.read_text(encoding='utf-8') == unicode_content
-    
-    def test_save_markdown_file_empty_content(self, temp_output_dir):
-        """Test saving Markdown file with empty content."""
-        filepath = temp_output_dir / "empty_page.md"
+        assert saved_path.read_bytes() == sample_markdown_bytes
+    
+    @pytest.mark.parametrize("content,name", [
+        pytest.param("# Page with émojis 🎉\n\nContent with ñoño and 中文",
+                     "save_unicode_page.md", id="unicode"),
+        pytest.param("", "save_empty_page.md", id="empty"),
+    ])
+    def test_save_markdown_file_content(self, shared_output_dir, content, name):
+        """Test that save_markdown_file writes the content back unchanged."""
+        # Each case writes a file name no other test uses
+        filepath = shared_output_dir / name
         
-        saved_path = save_markdown_file("", filepath)
+        saved_path = save_markdown_file(content, filepath)
         
         assert saved_path.exists()
-        assert saved_path.read_text(encoding='utf-8') == ""
+        assert saved_path.read_bytes() == content.encode('utf-8')
+
+
+# Selectors the default email CSS must have a rule for, matched against
+# the stylesheet with spaces removed (e.g. 'h1{')
+BODY_SELECTORS = ('body',)
+HEADING_SELECTORS = ('h1', 'h2')
+TABLE_SELECTORS = ('table', 'th', 'td')
+LIST_SELECTORS = ('ul', 'ol', 'li')
+LINK_SELECTORS = ('a',)
+CODE_SELECTORS = ('code', 'pre')
+
+
+@pytest.fixture(scope="module")
+def email_css():
+    """Return the default email CSS, loaded once for the module."""
+    return load_email_css()
+
+
+@pytest.fixture(scope="module")
+def email_css_nospace(email_css):
+    """Return email_css with spaces removed, for matching selectors like 'h1{'."""
+    return email_css.replace(' ', '')
 
 
 @pytest.mark.unit
@@ -217,48 +196,35 @@ class TestLoadEmailCss:
         assert isinstance(css, str)
         assert len(css) > 0
     
-    def test_load_email_css_contains_body_style(self):
+    def test_load_email_css_contains_body_style(self, email_css_nospace):
         """Test that CSS contains body styling."""
-        css = load_email_css()
-        assert 'body {' in css or 'body{' in css.replace(' ', '')
+        assert_contains_all(email_css_nospace, [sel + "{" for sel in BODY_SELECTORS])
     
-    def test_load_email_css_contains_heading_styles(self):
+    def test_load_email_css_contains_heading_styles(self, email_css_nospace):
         """Test that CSS contains heading styles."""
-        css = load_email_css()
-        assert 'h1 {' in css or 'h1{' in css.replace(' ', '')
-        assert 'h2 {' in css or 'h2{' in css.replace(' ', '')
+        assert_contains_all(email_css_nospace, [sel + "{" for sel in HEADING_SELECTORS])
     
-    def test_load_email_css_contains_table_styles(self):
+    def test_load_email_css_contains_table_styles(self, email_css_nospace):
         """Test that CSS contains table styling."""
-        css = load_email_css()
-        assert 'table {' in css or 'table{' in css.replace(' ', '')
-        assert 'th {' in css or 'th{' in css.replace(' ', '')
-        assert 'td {' in css or 'td{' in css.replace(' ', '')
+        assert_contains_all(email_css_nospace, [sel + "{" for sel in TABLE_SELECTORS])
     
-    def test_load_email_css_contains_list_styles(self):
+    def test_load_email_css_contains_list_styles(self, email_css_nospace):
         """Test that CSS contains list styling."""
-        css = load_email_css()
-        assert 'ul {' in css or 'ul{' in css.replace(' ', '')
-        assert 'ol {' in css or 'ol{' in css.replace(' ', '')
-        assert 'li {' in css or 'li{' in css.replace(' ', '')
+        assert_contains_all(email_css_nospace, [sel + "{" for sel in LIST_SELECTORS])
     
-    def test_load_email_css_contains_link_styles(self):
+    def test_load_email_css_contains_link_styles(self, email_css_nospace):
         """Test that CSS contains link styling."""
-        css = load_email_css()
-        assert 'a {' in css or 'a{' in css.replace(' ', '')
+        assert_contains_all(email_css_nospace, [sel + "{" for sel in LINK_SELECTORS])
     
-    def test_load_email_css_contains_code_styles(self):
+    def test_load_email_css_contains_code_styles(self, email_css_nospace):
         """Test that CSS contains code block styling."""
-        css = load_email_css()
-        assert 'code {' in css or 'code{' in css.replace(' ', '')
-        assert 'pre {' in css or 'pre{' in css.replace(' ', '')
+        assert_contains_all(email_css_nospace, [sel + "{" for sel in CODE_SELECTORS])
     
-    def test_load_email_css_contains_typography(self):
+    def test_load_email_css_contains_typography(self, email_css):
         """Test that CSS contains typography styles."""
-        css = load_email_css()
-        assert 'font-family' in css
-        assert 'font-size' in css
-        assert 'line-height' in css
+        assert 'font-family' in email_css
+        assert 'font-size' in email_css
+        assert 'line-height' in email_css
 
 
 @pytest.mark.unit
@@ -270,10 +236,7 @@ class TestWrapHtmlWithCss:
         html = "<h1>Hello</h1><p>World</p>"
         wrapped = wrap_html_with_css(html)
         
-        assert '<html' in wrapped.lower()
-        assert '<head' in wrapped.lower()
-        assert '<body' in wrapped.lower()
-        assert '<style' in wrapped.lower()
+        assert_contains_all(wrapped, ('<html', '<head', '<body', '<style'), ignore_case=True)
         assert 'h1' in wrapped
         assert 'Hello' in wrapped
         assert 'World' in wrapped
@@ -282,13 +245,14 @@ class TestWrapHtmlWithCss:
         """Test that wrapped HTML includes CSS content."""
         html = "<p>Test</p>"
         wrapped = wrap_html_with_css(html)
+        wl = wrapped.lower()
         
         # Check that CSS is included in style tag
-        assert '<style' in wrapped.lower()
-        assert '</style>' in wrapped.lower()
+        assert '<style' in wl
+        assert '</style>' in wl
         # CSS should contain body styling
-        css_start = wrapped.lower().find('<style')
-        css_end = wrapped.lower().find('</style>')
+        css_start = wl.find('<style')
+        css_end = wl.find('</style>')
         css_content = wrapped[css_start:css_end]
         assert 'body' in css_content or 'font-family' in css_content
     
@@ -315,11 +279,7 @@ class TestWrapHtmlWithCss:
         wrapped = wrap_html_with_css(html)
         
         # Should still have the structure
-        assert '<html' in wrapped.lower()
-        assert '<head' in wrapped.lower()
-        assert '<body' in wrapped.lower()
-        # Should have style tag
-        assert '<style' in wrapped.lower()
+        assert_contains_all(wrapped, ('<html', '<head', '<body', '<style'), ignore_case=True)
         # Should preserve original content
         assert 'Hello' in wrapped
     
@@ -328,10 +288,7 @@ class TestWrapHtmlWithCss:
         html = "<body><p>Content</p></body>"
         wrapped = wrap_html_with_css(html)
         
-        assert '<html' in wrapped.lower()
-        assert '<head' in wrapped.lower()
-        assert '<body' in wrapped.lower()
-        assert '<style' in wrapped.lower()
+        assert_contains_all(wrapped, ('<html', '<head', '<body', '<style'), ignore_case=True)
         assert 'Content' in wrapped
     
     def test_wrap_html_with_css_preserves_content(self):
@@ -361,19 +318,18 @@ class TestWrapHtmlWithCss:
         """Test that wrapped HTML includes meta tags."""
         html = "<p>Test</p>"
         wrapped = wrap_html_with_css(html)
+        wl = wrapped.lower()
         
-        assert 'charset' in wrapped.lower()
-        assert 'utf-8' in wrapped.lower()
-        assert 'viewport' in wrapped.lower() or 'meta' in wrapped.lower()
+        assert 'charset' in wl
+        assert 'utf-8' in wl
+        assert 'viewport' in wl or 'meta' in wl
     
     def test_wrap_html_with_css_empty_content(self):
         """Test wrapping empty HTML content."""
         html = ""
         wrapped = wrap_html_with_css(html)
         
-        assert '<html' in wrapped.lower()
-        assert '<body' in wrapped.lower()
-        assert '<style' in wrapped.lower()
+        assert_contains_all(wrapped, ('<html', '<body', '<style'), ignore_case=True)
     
     def test_wrap_html_with_css_complex_content(self):
         """Test wrapping complex HTML with various elements."""